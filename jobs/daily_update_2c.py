@@ -41,6 +41,9 @@ import csv
 from datetime import datetime, timezone, timedelta
 import yaml
 
+# 설정 파일용 YAML 로더 (libyaml 빌드면 CSafeLoader)
+_YamlLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 def run_command(cmd: list[str]) -> str:
     """
     서브프로세스로 명령어 실행 및 결과 반환
@@ -360,7 +363,7 @@ def main(cfg_path="config/settings.yaml"):
     # 설정 로드
     try:
         with open(cfg_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f)
+            cfg = yaml.load(f, Loader=_YamlLoader)
     except Exception as e:
         print(f"❌ 설정 파일 로드 실패: {e}")
         return 1
@@ -8,9 +8,12 @@
 
 import csv
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 import os
 import yaml
 
+_YamlLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 def ensure_header(ws, header):
     """헤더 확인 및 설정"""
     cur = ws.row_values(1)
@@ -37,18 +40,20 @@ def append_rows(ws, rows: list[dict], header: list[str]) -> int:
     if not rows:
         return 0
     
-    # 시트의 실제 헤더 사용
-    actual_header = ws.row_values(1)
+    # 시트의 실제 헤더 사용 (비어 있으면 전달받은 헤더)
+    actual_header = ws.row_values(1) or header
+    
+    # 누락 키를 ""로 채운 뒤 itemgetter(C 구현)로 헤더 순서대로 한 번에 꺼냄
+    defaults = dict.fromkeys(actual_header, "")
+    getter = itemgetter(*actual_header)
+    single_col = len(actual_header) == 1
     
     values = []
     for row in rows:
-        row_values = []
-        for col in actual_header:
-            value = row.get(col, "")
-            if value is None:
-                value = ""
-            row_values.append(str(value))
-        values.append(row_values)
+        picked = getter({**defaults, **row})
+        if single_col:
+            picked = (picked,)
+        values.append(["" if v is None else str(v) for v in picked])
     
     ws.append_rows(values, value_input_option="RAW")
     return len(values)
@@ -127,7 +132,8 @@ def main(csv_path: str, cfg_path="config/settings.yaml"):
     print(f"CSV 파일 로드 시작: {csv_path}")
     
     # 설정 로드
-    cfg = yaml.safe_load(open(cfg_path, "r", encoding="utf-8"))
+    with open(cfg_path, "r", encoding="utf-8") as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
     
     # 시트 열기
     ws = open_ws(cfg)
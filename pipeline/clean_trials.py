@@ -26,6 +26,7 @@
   -i, --input       입력 CSV 파일 경로
   -o, --output      출력 CSV 파일 경로  
   --backup          원본 파일 백업 생성
+  -j, --jobs        병렬 처리 프로세스 수 (기본: CPU 개수)
 
 작성자: 데이터 정제 파이프라인
 최종 수정: 2025-09-12
@@ -35,6 +36,7 @@ import re
 import argparse
 import os
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Tuple
 from pathlib import Path
@@ -42,6 +44,12 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+try:  # 선택 의존성: write_csv(use_pyarrow=True)일 때 C++ CSV writer 사용
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 
 # =============================================================================
 # 데이터 정제 설정
@@ -95,6 +103,9 @@ DATE_FMTS = [
     "%Y/%m/%d"    # 2024/03/15 형식
 ]
 
+# 병렬 처리 시 샤드당 최소 행 수 (이보다 작으면 프로세스 생성 비용이 더 큼)
+MIN_ROWS_PER_SHARD = 2000
+
 
 # ---------------------------
 # 유틸
@@ -109,9 +120,24 @@ def read_csv_any(path: str) -> pd.DataFrame:
     return pd.read_csv(path, dtype=str)
 
 
-def write_csv(df: pd.DataFrame, path: str) -> None:
-    # BOM 없이 저장하도록 수정
-    df.to_csv(path, index=False, encoding="utf-8")  # utf-8-sig → utf-8로 변경
+def write_csv(df: pd.DataFrame, path: str, encoding: str = "utf-8", use_pyarrow: bool = False) -> None:
+    """
+    CSV 저장 (기본 BOM 없이 utf-8, 'utf-8-sig'면 BOM 포함).
+    use_pyarrow=True이고 pyarrow가 있으면 pyarrow writer 사용 — 대용량에서 빠르지만
+    문자열을 모두 따옴표로 감싸고 정수값 실수(97.0)를 97로 쓰는 등 출력 형식이 to_csv와 다름
+    """
+    if use_pyarrow and pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None  # 혼합 타입 컬럼 등은 pandas로 저장
+        if table is not None:
+            with open(path, "wb") as f:
+                if encoding == "utf-8-sig":
+                    f.write("\ufeff".encode("utf-8"))
+                pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=True))
+            return
+    df.to_csv(path, index=False, encoding=encoding)
 
 
 def looks_garbage_title(text: str) -> bool:
@@ -126,28 +152,27 @@ def looks_garbage_title(text: str) -> bool:
     return False
 
 
-def is_dummy_row(row: pd.Series) -> bool:
-    """더미(가짜) 행 판정"""
+def dummy_row_mask(df: pd.DataFrame) -> pd.Series:
+    """더미(가짜) 행 판정 (DataFrame 전체를 한 번에 계산)"""
     # 1) 제목 가비지/없음
-    if looks_garbage_title(row.get("임상시험명", np.nan)):
-        return True
+    if "임상시험명" in df.columns:
+        garbage_title_mask = df["임상시험명"].map(looks_garbage_title).astype(bool)
+    else:
+        garbage_title_mask = pd.Series(True, index=df.index)
     # 2) 핵심 3필드 전부 공란
-    empty_core = sum(
-        1 for c in CORE_FIELDS
-        if (not isinstance(row.get(c), str)) or (str(row.get(c)).strip() == "")
-    )
-    if empty_core >= len(CORE_FIELDS):
-        return True
+    core_empty_mask = pd.Series(True, index=df.index)
+    for c in CORE_FIELDS:
+        if c in df.columns:
+            core_empty_mask &= df[c].isna() | df[c].astype(str).str.strip().eq("")
     # 3) 유효 데이터 개수 너무 적음(전체에서 비어있지 않은 값 3개 이하)
-    non_null = (
-        row.astype(str)
-           .replace({"nan": ""})
-           .str.strip()
-           .replace("", np.nan)
-           .notna()
-           .sum()
+    #    기존 행 단위 row.astype(str) 규칙 그대로: "nan"/공백만 빈 값
+    #    (pandas 2에서는 None/pd.NA가 "None"/"<NA>" 문자열이 되어 값으로 셈, pandas 3은 결측 유지)
+    nonempty = (
+        df.astype(str)
+          .apply(lambda s: s.notna() & s.ne("nan") & s.str.strip().ne(""))
+          .sum(axis=1)
     )
-    return non_null <= 3
+    return garbage_title_mask | core_empty_mask | (nonempty <= 3)
 
 
 def trim_hospital_name(s: str) -> str:
@@ -268,16 +293,13 @@ def process(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         start_vals = start_end.apply(lambda x: x[0])
         end_vals   = start_end.apply(lambda x: x[1])
 
-        # 임시로 추가 후 위치 재배치(원본 바로 뒤)
-        df[start_col] = start_vals
-        df[end_col]   = end_vals
-
+        # 원본 바로 뒤에 제자리 삽입 (컬럼 재정렬용 전체 복사 없이)
+        existing = [c for c in (start_col, end_col) if c in df.columns]
+        if existing:
+            df.drop(columns=existing, inplace=True)
         insert_at = df.columns.get_loc("임상시험 기간") + 1
-        cols = df.columns.tolist()
-        cols.remove(start_col)
-        cols.remove(end_col)
-        cols[insert_at:insert_at] = [start_col, end_col]
-        df = df[cols]
+        df.insert(insert_at, start_col, start_vals)
+        df.insert(insert_at + 1, end_col, end_vals)
 
     # 1) 진행상태 분리 + 제목 정리
     if "임상시험명" in df.columns:
@@ -301,7 +323,7 @@ def process(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         df.drop(columns=drop_cols, inplace=True, errors="ignore")
 
     # 4) 더미 행 삭제
-    mask_dummy = df.apply(is_dummy_row, axis=1)
+    mask_dummy = dummy_row_mask(df)
     rep["dummy_rows_removed"] = int(mask_dummy.sum())
     df = df[~mask_dummy].reset_index(drop=True)
 
@@ -310,12 +332,48 @@ def process(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
     return df, rep
 
 
+def _process_shard(shard: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    """워커 프로세스에서 실행되는 샤드 단위 정제 (pickle 가능하도록 최상위 함수)"""
+    return process(shard)
+
+
+def process_parallel(df: pd.DataFrame, jobs: int | None = None) -> tuple[pd.DataFrame, dict]:
+    """
+    행 단위로 독립적인 정제 단계를 여러 CPU에 나눠 실행.
+    - df를 jobs개 샤드로 분할 → ProcessPoolExecutor로 process() 실행 → 순서대로 합침
+    - 데이터가 작거나 jobs <= 1이면 단일 프로세스 process()와 동일
+    """
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(df) // MIN_ROWS_PER_SHARD)
+    if jobs <= 1:
+        return process(df)
+
+    bounds = np.linspace(0, len(df), jobs + 1, dtype=int)
+    shards = [df.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        results = list(ex.map(_process_shard, shards))
+
+    out_shards = [r[0] for r in results]
+    reps = [r[1] for r in results]
+    df_out = pd.concat(out_shards, ignore_index=True)
+
+    rep = {"rows_in": len(df), "cols_in": len(df.columns)}
+    rep["drop_site_subcols"] = reps[0]["drop_site_subcols"]
+    rep["dummy_rows_removed"] = sum(r["dummy_rows_removed"] for r in reps)
+    rep["rows_out"] = len(df_out)
+    rep["cols_out"] = len(df_out.columns)
+    return df_out, rep
+
+
 def main():
     ap = argparse.ArgumentParser(description="clinical_trials_full.csv 가공 스크립트 (최신 통합본)")
     ap.add_argument("-i", "--input", required=True, help="입력 CSV 경로 (예: clinical_trials_full.csv)")
     # 출력은 선택으로 변경: 미지정 시 자동 'outputs/clean/<입력이름>_clean.csv'
     ap.add_argument("-o", "--output", required=False, help="출력 CSV 경로 (미지정 시 자동 저장)")
     ap.add_argument("--backup", action="store_true", help="입력 파일 백업본도 함께 생성")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="병렬 처리 프로세스 수 (기본: CPU 개수)")
+    ap.add_argument("--pyarrow-csv", action="store_true",
+                    help="pyarrow CSV writer로 저장 (대용량에서 빠름, 따옴표/실수 표기가 기본 출력과 다름)")
     args = ap.parse_args()
 
     src_path = Path(args.input)
@@ -350,8 +408,8 @@ def main():
 
     # 가공
     df = read_csv_any(str(src_path))
-    df_out, rep = process(df)
-    write_csv(df_out, str(out_path))
+    df_out, rep = process_parallel(df, jobs=args.jobs)
+    write_csv(df_out, str(out_path), use_pyarrow=args.pyarrow_csv)
 
     print("[완료] 저장:", out_path)
     for k, v in rep.items():
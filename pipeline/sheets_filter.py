@@ -38,6 +38,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 from sheets_io import client_from_sa, open_ws
 
+# libyaml이 있으면 C 로더 사용 (순수 Python 파서 대비 설정 로드가 빠름)
+_YamlLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 
 # =============================================================================
 # 필터링 기준 설정
@@ -54,6 +57,12 @@ INVESTIGATOR_INITIATED_PATTERNS = [
     "연구자 임상시험", "연구자주도", "연구자 주도", "IIT", "의사주도"
 ]
 
+# 키워드 목록별 단일 정규식 (행마다 키워드 루프를 돌지 않도록 미리 컴파일)
+HEALTHY_RE = re.compile("|".join(map(re.escape, HEALTHY_VOLUNTEER_KEYWORDS)), re.IGNORECASE)
+HEALTHY_PHASE_RE = re.compile(r"생동|BE|PK", re.IGNORECASE)
+INVESTIGATOR_RE = re.compile("|".join(map(re.escape, INVESTIGATOR_INITIATED_PATTERNS)))
+HOSPITAL_RE = re.compile(r"병원|의료원|센터|의과대학|대학교")
+
 # 2상 이상 패턴
 PHASE_2_PLUS_PATTERN = re.compile(
     r'(?:2상|2a상|2b상|2/3상|2-3상|3상|3a상|3b상|4상|II상|IIa상|IIb상|II/III상|III상|IIIa상|IIIb상|IV상)', 
@@ -71,13 +80,10 @@ def is_healthy_volunteer_study(row: pd.Series) -> bool:
     disease = str(row.get("대상질환명", "")).strip()
     phase = str(row.get("임상시험 단계", "")).strip()
     
-    text_to_check = f"{title} {disease}".lower()
-    
-    for keyword in HEALTHY_VOLUNTEER_KEYWORDS:
-        if keyword.lower() in text_to_check:
-            return True
+    if HEALTHY_RE.search(f"{title} {disease}"):
+        return True
     
-    if "생동" in phase or "BE" in phase.upper() or "PK" in phase.upper():
+    if HEALTHY_PHASE_RE.search(phase):
         return True
         
     return False
@@ -89,12 +95,10 @@ def is_investigator_initiated(row: pd.Series) -> bool:
     phase = str(row.get("임상시험 단계", "")).strip()
     title = str(row.get("임상시험명", "")).strip()
     
-    for pattern in INVESTIGATOR_INITIATED_PATTERNS:
-        if pattern in phase or pattern in title:
-            return True
+    if INVESTIGATOR_RE.search(phase) or INVESTIGATOR_RE.search(title):
+        return True
     
-    hospital_patterns = ["병원", "의료원", "센터", "의과대학", "대학교"]
-    if any(pattern in sponsor for pattern in hospital_patterns):
+    if HOSPITAL_RE.search(sponsor):
         return True
         
     return False
@@ -119,26 +123,14 @@ def extract_domestic_participants(participants_str: str) -> int:
     return 0
 
 
-def calculate_study_duration_months(start_month: str, end_month: str) -> int:
-    """연구 기간을 월 단위로 계산"""
-    if not start_month or not end_month:
-        return 0
+def calculate_study_duration_months(start_month: pd.Series, end_month: pd.Series) -> pd.Series:
+    """연구 기간을 월 단위로 계산 ('YYYY-MM' 컬럼 전체를 한 번에 처리, 형식 불일치는 0)"""
+    ym_pattern = r"^\s*(\d+)\s*-\s*(\d+)\s*$"
+    start = start_month.astype(str).str.extract(ym_pattern).astype("float64")
+    end = end_month.astype(str).str.extract(ym_pattern).astype("float64")
     
-    try:
-        start_parts = str(start_month).split('-')
-        end_parts = str(end_month).split('-')
-        
-        if len(start_parts) != 2 or len(end_parts) != 2:
-            return 0
-            
-        start_year, start_mon = int(start_parts[0]), int(start_parts[1])
-        end_year, end_mon = int(end_parts[0]), int(end_parts[1])
-        
-        duration = (end_year - start_year) * 12 + (end_mon - start_mon)
-        return max(0, duration)
-        
-    except (ValueError, IndexError):
-        return 0
+    duration = (end[0] - start[0]) * 12 + (end[1] - start[1])
+    return duration.clip(lower=0).fillna(0).astype("int64")
 
 
 # =============================================================================
@@ -220,11 +212,9 @@ def apply_premium_filters(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
     stats["stages"]["min_10_participants"] = len(current_df)
     
     # 5. 모집기간 12개월 이상
-    current_df["연구기간_월"] = current_df.apply(
-        lambda row: calculate_study_duration_months(
-            row["임상시험 시작월"], 
-            row["임상시험 종료월"]
-        ), axis=1
+    current_df["연구기간_월"] = calculate_study_duration_months(
+        current_df["임상시험 시작월"], 
+        current_df["임상시험 종료월"]
     )
     mask_duration = current_df["연구기간_월"] >= 12
     current_df = current_df[mask_duration]
@@ -288,6 +278,36 @@ def setup_contact_status_dropdown(ws, header: list[str]):
     except Exception as e:
         print(f"⚠️ 드롭다운 설정 실패: {e}")
 
+def read_existing_contact_status(ws) -> Dict[str, str]:
+    """기존 시트에서 clncTestSn → 컨택상태 매핑 읽기 (필요한 두 컬럼만 요청)"""
+    from gspread.utils import rowcol_to_a1
+
+    header = ws.row_values(1)
+    if "clncTestSn" not in header:
+        return {}
+
+    sn_col = header.index("clncTestSn") + 1
+    sn_letter = rowcol_to_a1(1, sn_col)[:-1]
+    if "컨택상태" not in header:
+        sn_values = ws.get(f"{sn_letter}2:{sn_letter}")
+        return {str(r[0]): "데이터없음" for r in sn_values if r and r[0]}
+
+    contact_col = header.index("컨택상태") + 1
+    contact_letter = rowcol_to_a1(1, contact_col)[:-1]
+    sn_values, contact_values = ws.batch_get([
+        f"{sn_letter}2:{sn_letter}",
+        f"{contact_letter}2:{contact_letter}",
+    ])
+
+    existing_contact_status = {}
+    for i, r in enumerate(sn_values):
+        if not r or not r[0]:
+            continue
+        contact = contact_values[i] if i < len(contact_values) else []
+        existing_contact_status[str(r[0])] = contact[0] if contact else ""
+    return existing_contact_status
+
+
 def create_filtered_worksheets(cfg: Dict, base_df: pd.DataFrame, premium_df: pd.DataFrame) -> None:
     """필터링된 데이터를 별도 워크시트에 저장"""
     print("📝 필터링된 워크시트 생성 중...")
@@ -331,12 +351,7 @@ def create_filtered_worksheets(cfg: Dict, base_df: pd.DataFrame, premium_df: pd.
             # 기존 컨택상태 보존을 위해 기존 데이터 먼저 읽기
             existing_contact_status = {}
             try:
-                existing_records = ws.get_all_records()
-                existing_contact_status = {
-                    str(record.get("clncTestSn", "")): record.get("컨택상태", "데이터없음")
-                    for record in existing_records
-                    if record.get("clncTestSn")
-                }
+                existing_contact_status = read_existing_contact_status(ws)
                 print(f"📋 기존 컨택상태 {len(existing_contact_status)}개 보존됨")
             except Exception as e:
                 print(f"⚠️ 기존 컨택상태 읽기 실패 (빈 시트일 수 있음): {e}")
@@ -418,7 +433,7 @@ def main(cfg_path: str = "config/settings.yaml"):
     try:
         # 설정 로드
         with open(cfg_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f)
+            cfg = yaml.load(f, Loader=_YamlLoader)
         
         # 1단계: 구글 시트에서 데이터 읽기
         full_df = read_sheet_data(cfg)
@@ -1,25 +1,102 @@
-import gspread
-from google.oauth2.service_account import Credentials
+import random
+import time
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+# gspread / google-auth는 무거우므로 실제 시트 작업 시점에 import (CLI --help, 로컬 CSV 처리 시작 속도)
+if TYPE_CHECKING:  # 타입 힌트 전용 (런타임 import 없음)
+    import gspread
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# 헤더(1행) 캐시 유효 시간(초): 같은 워크시트에 대한 반복 조회 시 HTTP 호출 생략
+HEADER_CACHE_TTL = 60
+
+# append_rows 분할 크기(행)와 재시도 설정: 요청 크기 제한(10MB)·429(rate limit) 대응
+APPEND_CHUNK_ROWS = 500
+APPEND_MAX_TRIES = 5
+APPEND_BACKOFF = 2.0
+
+# 재시도할 HTTP 상태: rate limit(429)만 — 요청이 거부된 것이라 다시 보내도 중복 없음.
+# 5xx는 서버가 이미 행을 추가한 뒤 실패를 응답했을 수 있어(append는 멱등 아님) 재시도하지 않고 실패 처리
+_RETRY_STATUS = {429}
+
 def client_from_sa(sa_json_path: str):
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     creds = Credentials.from_service_account_file(sa_json_path, scopes=SCOPES)
     return gspread.authorize(creds)
 
 def open_ws(gc, sheet_id: str, ws_name: str):
+    import gspread
+
     sh = gc.open_by_key(sheet_id)
     try:
         return sh.worksheet(ws_name)
     except gspread.WorksheetNotFound:
         return sh.add_worksheet(ws_name, rows=1000, cols=26)
 
+def _set_header_cache(ws, header: list[str]):
+    ws._header_cache = (ws.id, time.monotonic(), header)
+
+def _cached_header(ws) -> list[str]:
+    """ws 객체에 붙여 둔 헤더 캐시 사용 (ws.id 일치 + TTL 이내), 없으면 1행 조회"""
+    cache = getattr(ws, "_header_cache", None)
+    if cache and cache[0] == ws.id and time.monotonic() - cache[1] < HEADER_CACHE_TTL:
+        return cache[2]
+    header = ws.row_values(1)
+    _set_header_cache(ws, header)
+    return header
+
+def _a1_range(ws, rng: str) -> str:
+    title = ws.title.replace("'", "''")
+    return f"'{title}'!{rng}"
+
+def _fetch_header_and_column(ws, col_name: str, value_render_option: str = "FORMATTED_VALUE") -> tuple[list[str], list]:
+    """
+    헤더(1행)와 col_name 컬럼(헤더 제외)을 values_batch_get 한 번으로 조회.
+    컬럼 위치는 캐시된 헤더로 결정하고, 응답의 최신 헤더로 캐시를 갱신.
+    value_render_option="UNFORMATTED_VALUE"면 숫자 셀은 문자열이 아닌 숫자로 받음.
+    - 헤더는 str() 형태로 비교 (UNFORMATTED_VALUE면 숫자 헤더 셀이 int로 옴),
+      캐시는 row_values(1)과 같은 FORMATTED_VALUE 응답으로만 갱신
+    - 두 번 조회해도 헤더가 맞지 않으면 1행을 다시 읽고 col_values로 직접 조회
+    """
+    from gspread.utils import rowcol_to_a1
+
+    header = _cached_header(ws)
+    for _ in range(2):
+        if col_name not in header:
+            return header, []
+        col_letter = rowcol_to_a1(1, header.index(col_name) + 1)[:-1]
+        res = ws.spreadsheet.values_batch_get(
+            ranges=[_a1_range(ws, "1:1"), _a1_range(ws, f"{col_letter}:{col_letter}")],
+            params={"valueRenderOption": value_render_option},
+        )
+        header_vr, col_vr = res.get("valueRanges", [{}, {}])
+        fresh_header = [str(h) for h in (header_vr.get("values") or [[]])[0]]
+        if value_render_option == "FORMATTED_VALUE":
+            _set_header_cache(ws, fresh_header)
+        if fresh_header == [str(h) for h in header]:
+            col_rows = col_vr.get("values", [])[1:]
+            return header, [r[0] if r else "" for r in col_rows]
+        # 캐시가 오래되어 컬럼 위치가 바뀌었을 수 있음 → 최신 헤더로 한 번 더 조회
+        header = fresh_header
+
+    # 헤더가 계속 어긋남 → 빈 결과로 넘기지 않고(키 목록/최대 SN 유실) 헤더와 컬럼을 따로 직접 조회
+    header = ws.row_values(1)
+    _set_header_cache(ws, header)
+    if col_name not in header:
+        return header, []
+    return header, ws.col_values(header.index(col_name) + 1, value_render_option=value_render_option)[1:]
+
 def ensure_header(ws, header: list[str]):
-    cur = ws.row_values(1)
+    cur = _cached_header(ws)
     if cur == header:
         return
     if not cur:
         ws.append_row(header)
+        _set_header_cache(ws, list(header))
     else:
         # 간단: 헤더 다르면 덮지 않고 일단 사용자가 정렬 후 재실행 권장
         missing = [h for h in header if h not in cur]
@@ -27,30 +104,64 @@ def ensure_header(ws, header: list[str]):
             raise RuntimeError(f"시트 헤더 불일치. 누락: {missing}")
 
 def list_existing_keys(ws, key_col="approval_no") -> set[str]:
-    header = ws.row_values(1)
-    if key_col not in header:
-        return set()
-    idx = header.index(key_col) + 1
-    vals = ws.col_values(idx)[1:]
+    _, vals = _fetch_header_and_column(ws, key_col)
     return set(v.strip() for v in vals if v.strip())
 
 def read_column_as_int(ws, col_name="clncTestSn") -> list[int]:
-    header = ws.row_values(1)
-    if col_name not in header:
-        return []
-    idx = header.index(col_name) + 1
-    vals = ws.col_values(idx)[1:]
+    # 서식 없는 값으로 받으면 숫자 셀은 이미 int/float → 문자열 파싱 불필요
+    _, vals = _fetch_header_and_column(ws, col_name, value_render_option="UNFORMATTED_VALUE")
     out = []
     for v in vals:
-        try:
-            out.append(int(v))
-        except:
-            pass
+        if isinstance(v, bool):
+            continue
+        if isinstance(v, int):
+            out.append(v)
+        elif isinstance(v, float):
+            if v.is_integer():
+                out.append(int(v))
+        else:
+            # 텍스트로 저장된 숫자
+            try:
+                out.append(int(v))
+            except ValueError:
+                pass
     return out
 
+def _retry_delay(err: "gspread.exceptions.APIError", attempt: int, backoff: float):
+    """재시도할 오류(429)면 대기 시간(초), 아니면 None. Retry-After 헤더가 있으면 우선"""
+    response = getattr(err, "response", None)
+    if getattr(response, "status_code", None) not in _RETRY_STATUS:
+        return None
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return backoff ** attempt + random.uniform(0, 1)
+
+def _append_with_retry(ws, values: list[list], tries: int = APPEND_MAX_TRIES, backoff: float = APPEND_BACKOFF):
+    import gspread
+
+    for attempt in range(tries):
+        try:
+            return ws.append_rows(values, value_input_option="RAW")
+        except gspread.exceptions.APIError as e:
+            delay = _retry_delay(e, attempt, backoff)
+            if delay is None or attempt == tries - 1:
+                raise
+            print(f"⏳ Sheets API 요청 한도 초과({e.response.status_code}) → {delay:.1f}초 후 재시도 ({attempt + 1}/{tries - 1})")
+            time.sleep(delay)
+
 def append_rows(ws, rows: list[dict], header: list[str]) -> int:
+    """rows를 header 순서로 APPEND_CHUNK_ROWS 단위로 나눠 추가 (청크별 재시도). 추가한 행 수 반환"""
     if not rows:
         return 0
-    values = [[row.get(h, "") for h in header] for row in rows]
-    ws.append_rows(values, value_input_option="RAW")
+    # 누락 키를 ""로 채운 뒤 itemgetter로 헤더 순서대로 꺼냄 (셀마다 dict.get 호출 없음)
+    defaults = dict.fromkeys(header, "")
+    getter = itemgetter(*header)
+    if len(header) == 1:
+        values = [[getter({**defaults, **row})] for row in rows]
+    else:
+        values = [list(getter({**defaults, **row})) for row in rows]
+    for i in range(0, len(values), APPEND_CHUNK_ROWS):
+        _append_with_retry(ws, values[i:i + APPEND_CHUNK_ROWS])
     return len(values)
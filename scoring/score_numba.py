@@ -0,0 +1,136 @@
+"""
+numba 커널을 이용한 A/B/C/D 일괄 계산 (선택, 대용량 시트용)
+- 입력: urgency_scoring._encode_frame이 만든 정수 인코딩 배열
+  (진행상태 코드, 단계 점수, 기간 시작/종료 epoch 마이크로초, 질환 키워드 비트 등)
+- 행마다 분기하는 스칼라 규칙을 그대로 네이티브 코드로 컴파일해 prange 병렬 루프로 실행
+- numba 미설치 시 NUMBA_AVAILABLE = False → score_dataframe은 NumPy 경로를 사용
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba가 없으면 같은 커널을 순수 Python으로 실행 (검증/디버깅용, 느림)
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from scoring.urgency_scoring import (
+    MAXES_TUP,
+    _DF_CANCER,
+    _DF_FIH,
+    _DF_NEURO_IMMUNE,
+    _DF_RARE,
+    _ST_APPROVED,
+    _ST_RECRUITING,
+    _US_PER_DAY,
+    _now_us,
+    _vec_warnings,
+)
+
+# 이 행 수 이상일 때만 커널 사용 (작은 시트는 컴파일/스레드 기동 비용이 더 큼)
+NUMBA_MIN_ROWS = 10_000
+
+# numba 전역 상수로 쓰기 위해 dict 대신 정수로 풀어 둠
+_MAX_A, _MAX_B, _MAX_C, _MAX_D = MAXES_TUP
+
+@njit(parallel=True, cache=True)
+def score_kernel(
+    status_code, phase_pts, phase_1, target, period_ok, period_months, start_us, end_us,
+    approval_months, disease_flags, single_sex, narrow_age, now_us,
+    out_A, out_B, out_C, out_D,
+):
+    """행마다 A/B/C/D를 계산해 out_* 배열에 기록 (urgency_scoring의 스칼라 규칙과 동일)"""
+    for i in prange(status_code.shape[0]):
+        st = status_code[i]
+
+        # A: 진행상태 + 임상 단계
+        a = phase_pts[i]
+        if st == _ST_RECRUITING:
+            a += 15
+        elif st == _ST_APPROVED:
+            a += 10
+        out_A[i] = min(max(a, 0), _MAX_A)
+
+        # B: 월당 목표 인원 (기간 파싱 실패/0개월 이하 → 24개월 가정)
+        months = period_months[i] if period_months[i] > 0 else 24
+        spm = min(max(target[i] / months, 0.0), 10.0)
+        out_B[i] = np.int64(np.rint(5 + (spm / 10.0) * 20))
+
+        # C: 질환 난이도 + 보너스 + 성별/연령 제한
+        fl = disease_flags[i]
+        if fl & _DF_CANCER:
+            c = 15
+        elif fl & _DF_NEURO_IMMUNE:
+            c = 10
+        else:
+            c = 5
+        bonus = 0
+        if fl & _DF_RARE:
+            bonus += 3
+        if fl & _DF_NEURO_IMMUNE:
+            bonus += 2
+        if phase_1[i] and (fl & _DF_FIH) != 0:
+            bonus += 5
+        c += min(bonus, 5)
+        if single_sex[i]:
+            c += 5
+        if narrow_age[i]:
+            c += 5
+        out_C[i] = min(max(c, 0), _MAX_C)
+
+        # D: 시간 민감도
+        d = 0
+        if not period_ok[i]:
+            d = 5
+        elif st == _ST_RECRUITING:
+            total_days = max(1, (end_us[i] - start_us[i]) // _US_PER_DAY)
+            ratio = ((now_us - start_us[i]) // _US_PER_DAY) / total_days
+            if ratio >= 0.5:
+                d = 20
+            elif ratio >= 0.25:
+                d = 15
+            else:
+                d = 10
+        elif st == _ST_APPROVED:
+            if now_us > start_us[i]:
+                m = approval_months[i]
+                if m > 6:
+                    d = 15
+                elif m >= 3:
+                    d = 10
+                else:
+                    d = 5
+            else:
+                days_to_start = (start_us[i] - now_us) // _US_PER_DAY
+                if days_to_start <= 30:
+                    d = 15
+                elif days_to_start <= 90:
+                    d = 10
+                else:
+                    d = 5
+        out_D[i] = d
+
+def score_arrays(enc: Dict[str, np.ndarray], now: datetime, with_warnings: bool = True):
+    """urgency_scoring._score_arrays와 같은 입출력 — A/B/C/D는 커널로, 경고 비트마스크는 NumPy로 계산"""
+    now_us = _now_us(now)
+    n = len(enc["status_code"])
+    A, B, C, D = (np.empty(n, dtype=np.int64) for _ in range(4))
+    args = [
+        np.ascontiguousarray(enc[k]) for k in (
+            "status_code", "phase_pts", "phase_1", "target", "period_ok", "period_months",
+            "start_us", "end_us", "approval_months", "disease_flags", "single_sex", "narrow_age",
+        )
+    ]
+    score_kernel(*args, now_us, A, B, C, D)
+    return A, B, C, D, _vec_warnings(enc, now_us) if with_warnings else None
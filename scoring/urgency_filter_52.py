@@ -8,6 +8,8 @@
 - 모집 압박 가중치 조정: 실제 시급성 반영
 """
 
+import hashlib
+import re
 import sys
 import os
 from pathlib import Path
@@ -22,8 +24,38 @@ from datetime import datetime
 import json
 
 # 로컬 스코어링 시스템 임포트
+from scoring import urgency_scoring
 from scoring.urgency_scoring import calculate_total_urgency_score, score_dataframe, WEIGHTS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow가 있으면 CSV 파싱을 pyarrow 엔진으로 (멀티스레드, 없으면 기본 C 엔진)
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# pyarrow 엔진은 YYYY-MM-DD 값을 날짜형으로 추론하므로 읽은 뒤 문자열로 되돌릴 날짜 컬럼 (스코어러는 문자열 기대).
+# read_csv(dtype=...)로 지정하면 pyarrow가 다른 컬럼까지 캐스팅하다 빈 정수 셀에서 실패하므로 사후 변환
+DATE_TEXT_COLUMNS = ['임상시험 승인일자', '최근 변경일자']
+
+# score_dataframe이 붙이는 컬럼 (스코어링 캐시에서 원본 컬럼 복원용)
+SCORED_COLUMNS = ['A', 'B', 'C', 'D', 'total_score', 'total_score_adjusted', 'warnings', 'warnings_mask', 'mode']
+
+# 기본 스코어링 결과에 영향을 주는 소스 (스코어링 캐시 키에 포함 — 하나라도 바뀌면 캐시 무효)
+SCORING_SOURCES = [
+    Path(urgency_scoring.__file__),
+    Path(urgency_scoring.__file__).with_name("score_numba.py"),
+    Path(__file__),  # 로드 시 전처리(날짜 문자열화, 카테고리 변환)
+]
+
+# 진행상태 기본 카테고리 (데이터에만 있는 값은 로드 시 뒤에 추가)
+STATUS_CATEGORIES = ['모집중', '승인완료', '모집완료', '종료']
+
 class ImprovedUrgencyFilter:
     def __init__(self, csv_path: str = None):
         """개선된 시급성 필터 초기화"""
@@ -36,6 +68,8 @@ class ImprovedUrgencyFilter:
         
         self.df = None
         self.scored_df = None
+        self._base_scored = None  # 기본(auto) 스코어링 결과 캐시 — 가중치 모드만 바꿀 때 재사용
+        self._cache_path = None   # 기본 스코어링 결과 Parquet 캐시 경로 (입력 해시 기준)
         
         # 개선된 가중치 시나리오 추가
         self.custom_weights = {
@@ -61,45 +95,107 @@ class ImprovedUrgencyFilter:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {self.csv_path}")
         
-        self.df = pd.read_csv(self.csv_path, encoding='utf-8-sig')
+        self.df = pd.read_csv(self.csv_path, encoding='utf-8-sig', engine=CSV_ENGINE)
+        self._base_scored = None
+        for col in DATE_TEXT_COLUMNS:
+            if col in self.df.columns and not pd.api.types.is_string_dtype(self.df[col]):
+                # 날짜로 추론된 컬럼만 'YYYY-MM-DD' 문자열로 (빈 셀은 NaN 유지)
+                self.df[col] = pd.to_datetime(self.df[col]).dt.strftime('%Y-%m-%d')
+        
+        # 반복 비교/집계되는 컬럼은 카테고리형으로 (isin/value_counts가 정수 코드 기준으로 동작)
+        self.df['진행상태'] = self._as_category(self.df['진행상태'], STATUS_CATEGORIES)
+        self.df['임상시험 단계'] = self._as_category(self.df['임상시험 단계'])
         
         print(f"✅ 로드 완료: {len(self.df):,}건")
         
         # 기본 통계
-        status_counts = self.df['진행상태'].value_counts()
+        status_counts = self._value_counts(self.df['진행상태'])
         print(f"\n📈 진행상태별 분포:")
         for status, count in status_counts.items():
             print(f"   {status}: {count:,}건")
             
         return self.df
     
+    def _scored_cache_file(self) -> Path:
+        """
+        기본 스코어링 캐시 파일 경로: _cache_<CSV 경로 키>_<입력 해시>.parquet
+        - 입력 해시: CSV 내용 + 점수에 영향을 주는 모듈 소스(SCORING_SOURCES) + 기준일
+        - CSV 경로 키: 같은 CSV의 이전 캐시만 골라 지우기 위한 구분자
+        """
+        if self._cache_path is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(self.csv_path.read_bytes())
+            for src in SCORING_SOURCES:
+                if src.exists():
+                    h.update(src.name.encode())
+                    h.update(src.read_bytes())
+            h.update(datetime.now().strftime("%Y%m%d").encode())  # D/경고는 날짜 기준이므로 하루 단위로 갱신
+            self._cache_path = self.output_dir / f"{self._cache_prefix()}{h.hexdigest()}.parquet"
+        return self._cache_path
+    
+    def _cache_prefix(self) -> str:
+        csv_key = hashlib.blake2b(str(self.csv_path.resolve()).encode(), digest_size=8).hexdigest()
+        return f"_cache_{csv_key}_"
+    
+    def load_cached_scores(self) -> bool:
+        """같은 입력의 스코어링 캐시가 있으면 불러와 CSV 파싱/기본 스코어링 생략. 성공 여부 반환"""
+        if not self.csv_path.exists():
+            return False
+        cache_file = self._scored_cache_file()
+        if not cache_file.exists():
+            return False
+        try:
+            self._base_scored = pd.read_parquet(cache_file)
+        except Exception as e:
+            print(f"⚠️ 스코어링 캐시 읽기 실패 ({e}) → CSV에서 다시 계산")
+            return False
+        self.df = self._base_scored.drop(columns=SCORED_COLUMNS)
+        print(f"\n⚡ 스코어링 캐시 사용: {cache_file.name} ({len(self.df):,}건)")
+        return True
+    
+    def _save_scored_cache(self):
+        """기본 스코어링 결과를 Parquet로 저장 (같은 CSV의 이전 캐시는 삭제, pyarrow 없으면 생략)"""
+        cache_file = self._scored_cache_file()
+        try:
+            self._base_scored.to_parquet(cache_file, compression='zstd')
+        except Exception as e:
+            print(f"⚠️ 스코어링 캐시 저장 생략: {e}")
+            return
+        # 같은 CSV의 이전 캐시만 삭제 (다른 CSV/날짜로 실행한 캐시는 유지)
+        for old in self.output_dir.glob(f"{self._cache_prefix()}*.parquet"):
+            if old != cache_file:
+                old.unlink()
+    
     def apply_custom_scoring(self, weight_mode: str = "balanced_urgent"):
         """개선된 가중치로 스코어링"""
         print(f"\n🔬 개선된 스코어링 적용 (mode: {weight_mode})")
         
-        # 기본 스코어링 먼저 실행
-        self.scored_df = score_dataframe(
-            self.df, 
-            mode="auto", 
-            current_date=datetime.now(),
-            with_adjustment=True
-        )
+        # 기본 스코어링 먼저 실행 (데이터가 그대로면 이전 결과 재사용)
+        if self._base_scored is None:
+            self._base_scored = score_dataframe(
+                self.df, 
+                mode="auto", 
+                current_date=datetime.now(),
+                with_adjustment=True
+            )
+            self._save_scored_cache()
         
         # 커스텀 가중치가 있으면 재계산
         if weight_mode in self.custom_weights:
             print(f"🎛️ 커스텀 가중치 적용: {weight_mode}")
             weights = self.custom_weights[weight_mode]
             
-            # 새로운 total_score_custom 계산
-            self.scored_df['total_score_custom'] = (
-                (self.scored_df['A'] / 30) * weights['A'] * 100 +
-                (self.scored_df['B'] / 25) * weights['B'] * 100 +
-                (self.scored_df['C'] / 25) * weights['C'] * 100 +
-                (self.scored_df['D'] / 20) * weights['D'] * 100
-            ).round(1)
+            # 새로운 total_score_custom 계산: A~D 배열에서 직접 누적
+            # (행렬곱은 부동소수 연산 순서가 달라져 소수 첫째 자리 반올림 결과가 바뀌므로 항별 순서 유지)
+            components = self._base_scored[['A', 'B', 'C', 'D']].to_numpy(dtype=np.float64)
+            total = np.zeros(len(components))
+            for i, (key, max_score) in enumerate((('A', 30), ('B', 25), ('C', 25), ('D', 20))):
+                total += (components[:, i] / max_score) * weights[key] * 100
+            self.scored_df = self._base_scored.assign(total_score_custom=np.round(total, 1))
             
             score_col = 'total_score_custom'
         else:
+            self.scored_df = self._base_scored
             score_col = 'total_score_adjusted'
         
         total_scores = self.scored_df[score_col]
@@ -121,8 +217,7 @@ class ImprovedUrgencyFilter:
         # 품질 필터링
         if 'warnings' in self.scored_df.columns:
             # 경고 개수 계산 (세미콜론으로 구분된 경고들)
-            warning_counts = self.scored_df['warnings'].str.split(';').str.len()
-            warning_counts = warning_counts.fillna(0)
+            warning_counts = self._count_warnings(self.scored_df)
             
             quality_filter = warning_counts <= quality_threshold
             filtered_df = self.scored_df[quality_filter].copy()
@@ -145,8 +240,26 @@ class ImprovedUrgencyFilter:
         # 질환 카테고리 분류
         active_df = self._categorize_diseases(active_df)
         
+        if len(active_df) <= n:
+            # 활성 건수가 n 이하면 전부 선택되므로 분포/할당 계산 생략
+            print(f"\n⏩ 활성 {len(active_df):,}건 ≤ {n}건: 전체 선택 (다양성 할당 생략)")
+            result_df = active_df
+        else:
+            result_df = self._select_diversified(active_df, n, score_col)
+        
+        # 최종 정렬: 두 경로 모두 원래 행 순서에서 점수 내림차순 stable 정렬 (동점은 입력 순서 → 결정적)
+        result_df = result_df.sort_values(score_col, ascending=False, kind='stable').head(n)
+        
+        print(f"\n✅ 최종 선별: {len(result_df)}건")
+        print(f"   점수 범위: {result_df[score_col].min():.1f} ~ {result_df[score_col].max():.1f}")
+        
+        return result_df
+    
+    def _select_diversified(self, active_df: pd.DataFrame, n: int, score_col: str) -> pd.DataFrame:
+        """카테고리별 할당량만큼 점수 상위 행 선택 후 부족분은 전체 점수순으로 보충"""
+        
         # 카테고리별 분포 확인
-        category_counts = active_df['disease_category'].value_counts()
+        category_counts = self._value_counts(active_df['disease_category'])
         print(f"\n🏥 질환 카테고리별 분포:")
         for cat, count in category_counts.items():
             print(f"   {cat}: {count:,}건")
@@ -158,49 +271,68 @@ class ImprovedUrgencyFilter:
         for cat, target in target_distribution.items():
             print(f"   {cat}: {target}건")
         
-        # 카테고리별 선별
-        selected_trials = []
+        # 카테고리별 선택 건수 결정
+        quotas = {}
         remaining_slots = n
         
         for category, target_count in target_distribution.items():
-            category_df = active_df[active_df['disease_category'] == category]
+            available = category_counts.get(category, 0)
             
-            if len(category_df) == 0:
+            if available == 0:
                 continue
                 
             # 해당 카테고리에서 상위 N건 선택
-            actual_count = min(target_count, len(category_df), remaining_slots)
+            actual_count = min(target_count, available, remaining_slots)
             
             if actual_count > 0:
-                top_category = category_df.nlargest(actual_count, score_col)
-                selected_trials.append(top_category)
+                quotas[category] = actual_count
                 remaining_slots -= actual_count
                 
                 print(f"   ✅ {category}: {actual_count}건 선택 (목표: {target_count})")
         
-        # 합치기
-        if selected_trials:
-            result_df = pd.concat(selected_trials, ignore_index=False)
-        else:
-            result_df = pd.DataFrame()
-        
-        # 부족하면 전체에서 추가 선별
-        if len(result_df) < n and remaining_slots > 0:
+        # 점수순으로 한 번만 정렬(동점은 원래 순서 유지 = nlargest와 동일)한 뒤
+        # 카테고리 내 순위가 할당량 미만인 행의 위치만 모음 (중간 DataFrame 생성/concat 없음)
+        ranked_pos = np.argsort(-active_df[score_col].to_numpy(), kind='stable')
+        codes = active_df['disease_category'].cat.codes.to_numpy()
+        category_names = active_df['disease_category'].cat.categories
+        ranked_codes = codes[ranked_pos]
+        rank_in_category = pd.Series(ranked_codes).groupby(ranked_codes).cumcount().to_numpy()
+        quota_by_code = np.array([quotas.get(c, 0) for c in category_names])
+        selected_pos = ranked_pos[rank_in_category < quota_by_code[ranked_codes]]
+        
+        # 부족하면 전체에서 추가 선별 (남은 행 중 점수 상위)
+        if len(selected_pos) < n and remaining_slots > 0:
             print(f"\n🔄 부족분 보충: {remaining_slots}건")
-            excluded_indices = result_df.index
-            remaining_df = active_df[~active_df.index.isin(excluded_indices)]
-            
-            additional = remaining_df.nlargest(remaining_slots, score_col)
-            if len(additional) > 0:
-                result_df = pd.concat([result_df, additional])
-        
-        # 최종 정렬
-        result_df = result_df.sort_values(score_col, ascending=False).head(n)
-        
-        print(f"\n✅ 최종 선별: {len(result_df)}건")
-        print(f"   점수 범위: {result_df[score_col].min():.1f} ~ {result_df[score_col].max():.1f}")
+            additional = ranked_pos[~np.isin(ranked_pos, selected_pos)][:remaining_slots]
+            selected_pos = np.concatenate([selected_pos, additional])
         
-        return result_df
+        # 원래 행 순서로 반환 (최종 점수 정렬에서 동점 순서를 전체 선택 경로와 같게)
+        return active_df.iloc[np.sort(selected_pos)]
+    
+    @staticmethod
+    def _as_category(values: pd.Series, known=()) -> pd.Series:
+        """문자열 컬럼 → Categorical (known 카테고리를 먼저 등록하고 나머지는 등장 순서대로 추가)"""
+        extra = [v for v in pd.unique(values.dropna()) if v not in known]
+        return values.astype(pd.CategoricalDtype(list(known) + extra))
+    
+    @staticmethod
+    def _value_counts(values: pd.Series) -> pd.Series:
+        """value_counts와 같은 결과 (0건 카테고리 제외, 동률은 처음 등장한 순서)"""
+        counts = values.value_counts(sort=False)
+        counts = counts[counts > 0].reindex(list(pd.unique(values.dropna())))
+        return counts.sort_values(ascending=False, kind='stable')
+    
+    @staticmethod
+    def _count_warnings(df: pd.DataFrame) -> pd.Series:
+        """
+        행별 경고 개수 — warnings_mask가 있으면 비트 수로 계산,
+        없으면 세미콜론 구분 경고 문자열에서 (빈 값은 0개, 리스트 생성 없이 str.count 사용)
+        """
+        if 'warnings_mask' in df.columns:
+            return pd.Series(urgency_scoring.count_warning_bits(df['warnings_mask'].to_numpy()), index=df.index)
+        w = df['warnings'].fillna('')
+        counts = np.where(w.eq(''), 0, w.str.count(';').to_numpy() + 1)
+        return pd.Series(counts, index=df.index)
     
     def _categorize_diseases(self, df: pd.DataFrame) -> pd.DataFrame:
         """질환 카테고리 분류"""
@@ -222,11 +354,25 @@ class ImprovedUrgencyFilter:
             'Infectious': ['감염', 'infection', '바이러스', 'virus', '세균', 'bacteria']
         }
         
-        # 카테고리별 분류
-        for category, keywords in categories.items():
-            mask = disease_name.str.contains('|'.join(keywords), na=False, case=False)
-            df.loc[mask, 'disease_category'] = category
-        
+        # 카테고리별 분류: 카테고리마다 이름 있는 그룹으로 묶은 정규식 하나로 한 번만 스캔
+        # (전방탐색으로 감싸 겹치는 키워드도 모두 찾음)
+        pattern = re.compile(
+            '(?=' + '|'.join(
+                f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+                for category, keywords in categories.items()
+            ) + ')',
+            re.IGNORECASE
+        )
+        matches = disease_name.str.extractall(pattern)
+        if len(matches) > 0:
+            found = matches.notna().groupby(level=0).any()
+            # 여러 카테고리에 걸리면 뒤쪽 카테고리로 분류 (카테고리 순서대로 덮어쓰던 기존 동작과 동일)
+            last_category = found[found.columns[::-1]].idxmax(axis=1)
+            df.loc[last_category.index, 'disease_category'] = last_category
+        
+        df['disease_category'] = df['disease_category'].astype(
+            pd.CategoricalDtype(list(categories) + ['Others'])
+        )
         return df
     
     def _calculate_target_distribution(self, total_n: int, category_counts: pd.Series) -> dict:
@@ -315,12 +461,12 @@ class ImprovedUrgencyFilter:
                 ]
             },
             "diversity": {
-                "disease_categories": top_n_df['disease_category'].value_counts().to_dict(),
-                "category_percentages": (top_n_df['disease_category'].value_counts() / len(top_n_df) * 100).round(1).to_dict()
+                "disease_categories": self._value_counts(top_n_df['disease_category']).to_dict(),
+                "category_percentages": (self._value_counts(top_n_df['disease_category']) / len(top_n_df) * 100).round(1).to_dict()
             },
             "breakdown": {
-                "status": top_n_df['진행상태'].value_counts().to_dict(),
-                "phases": top_n_df['임상시험 단계'].value_counts().head(10).to_dict(),
+                "status": self._value_counts(top_n_df['진행상태']).to_dict(),
+                "phases": self._value_counts(top_n_df['임상시험 단계']).head(10).to_dict(),
                 "score_components": {
                     "A_상태_중요도": round(top_n_df['A'].mean(), 1),
                     "B_모집_압박": round(top_n_df['B'].mean(), 1), 
@@ -332,7 +478,7 @@ class ImprovedUrgencyFilter:
         
         # 품질 분석
         if 'warnings' in top_n_df.columns:
-            warning_counts = top_n_df['warnings'].str.split(';').str.len().fillna(0)
+            warning_counts = self._count_warnings(top_n_df)
             report["quality"] = {
                 "trials_with_warnings": int((warning_counts > 0).sum()),
                 "avg_warnings_per_trial": round(warning_counts.mean(), 2),
@@ -347,50 +493,59 @@ class ImprovedUrgencyFilter:
         """개선된 결과 저장"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # 1) CSV 저장
+        # 1) CSV 저장 (warnings_mask는 warnings 문자열과 같은 내용의 내부용 컬럼이라 제외)
         csv_file = self.output_dir / f"urgent_trials_top{n}_{strategy}_{timestamp}.csv"
-        top_n_df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+        top_n_df.drop(columns=['warnings_mask'], errors='ignore').to_csv(csv_file, index=False, encoding='utf-8-sig')
         
-        # 2) 리포트 JSON 저장
+        # 2) 리포트 JSON 저장 (orjson이 있으면 바이트로 바로 직렬화)
         report_file = self.output_dir / f"urgency_report_top{n}_{strategy}_{timestamp}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        if orjson is not None:
+            report_file.write_bytes(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+        else:
+            report_file.write_text(json.dumps(report, ensure_ascii=False, indent=2, default=str), encoding='utf-8')
         
-        # 3) 개선된 요약 리포트
+        # 3) 개선된 요약 리포트 (문자열을 모아 한 번에 저장)
         summary_file = self.output_dir / f"urgency_summary_top{n}_{strategy}_{timestamp}.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"🎯 개선된 시급성 임상시험 {n}건 선별 결과\n")
-            f.write("=" * 70 + "\n\n")
-            
-            f.write(f"📊 메타데이터:\n")
-            f.write(f"  - 분석 시간: {report['metadata']['generated_at']}\n")
-            f.write(f"  - 개선 버전: {report['metadata']['improvement_version']}\n")
-            f.write(f"  - 전체 분석: {report['metadata']['total_trials_analyzed']:,}건\n")
-            f.write(f"  - 활성 상태: {report['metadata']['active_trials']:,}건\n")
-            f.write(f"  - 최종 선별: {report['summary']['total_count']}건\n\n")
-            
-            f.write(f"📈 스코어 요약:\n")
-            f.write(f"  - 평균 점수: {report['summary']['avg_score']}점\n")
-            f.write(f"  - 점수 범위: {report['summary']['score_range'][0]} ~ {report['summary']['score_range'][1]}점\n\n")
-            
-            f.write("🎯 질환 다양성 (개선됨):\n")
-            for category, count in report['diversity']['disease_categories'].items():
-                percentage = report['diversity']['category_percentages'][category]
-                f.write(f"  - {category}: {count}건 ({percentage}%)\n")
+        parts = [
+            f"🎯 개선된 시급성 임상시험 {n}건 선별 결과\n",
+            "=" * 70 + "\n\n",
             
-            f.write(f"\n📋 진행상태별:\n")
-            for status, count in report['breakdown']['status'].items():
-                f.write(f"  - {status}: {count}건\n")
+            f"📊 메타데이터:\n",
+            f"  - 분석 시간: {report['metadata']['generated_at']}\n",
+            f"  - 개선 버전: {report['metadata']['improvement_version']}\n",
+            f"  - 전체 분석: {report['metadata']['total_trials_analyzed']:,}건\n",
+            f"  - 활성 상태: {report['metadata']['active_trials']:,}건\n",
+            f"  - 최종 선별: {report['summary']['total_count']}건\n\n",
             
-            f.write(f"\n🏥 임상시험 단계별:\n")
-            for phase, count in list(report['breakdown']['phases'].items())[:5]:
-                f.write(f"  - {phase}: {count}건\n")
+            f"📈 스코어 요약:\n",
+            f"  - 평균 점수: {report['summary']['avg_score']}점\n",
+            f"  - 점수 범위: {report['summary']['score_range'][0]} ~ {report['summary']['score_range'][1]}점\n\n",
             
-            if 'quality' in report:
-                f.write(f"\n⚡ 품질 개선:\n")
-                f.write(f"  - {report['quality']['quality_improvement']}\n")
-                f.write(f"  - 평균 경고: {report['quality']['avg_warnings_per_trial']}개/건\n")
-                f.write(f"  - 최대 경고: {report['quality']['max_warnings']}개\n")
+            "🎯 질환 다양성 (개선됨):\n",
+        ]
+        for category, count in report['diversity']['disease_categories'].items():
+            percentage = report['diversity']['category_percentages'][category]
+            parts.append(f"  - {category}: {count}건 ({percentage}%)\n")
+        
+        parts.append(f"\n📋 진행상태별:\n")
+        for status, count in report['breakdown']['status'].items():
+            parts.append(f"  - {status}: {count}건\n")
+        
+        parts.append(f"\n🏥 임상시험 단계별:\n")
+        for phase, count in list(report['breakdown']['phases'].items())[:5]:
+            parts.append(f"  - {phase}: {count}건\n")
+        
+        if 'quality' in report:
+            parts.append(f"\n⚡ 품질 개선:\n")
+            parts.append(f"  - {report['quality']['quality_improvement']}\n")
+            parts.append(f"  - 평균 경고: {report['quality']['avg_warnings_per_trial']}개/건\n")
+            parts.append(f"  - 최대 경고: {report['quality']['max_warnings']}개\n")
+        
+        summary_file.write_text("".join(parts), encoding='utf-8')
         
         print(f"\n💾 개선된 결과 저장:")
         print(f"  📄 {n}건 CSV: {csv_file.name}")
@@ -424,8 +579,9 @@ def main():
         # 1) 필터 시스템 초기화
         filter_system = ImprovedUrgencyFilter(args.csv)
         
-        # 2) 데이터 로드
-        filter_system.load_and_prepare_data()
+        # 2) 데이터 로드 (같은 입력의 스코어링 캐시가 있으면 CSV 파싱·기본 스코어링 생략)
+        if not filter_system.load_cached_scores():
+            filter_system.load_and_prepare_data()
         
         # 3) 개선된 스코어링
         filter_system.apply_custom_scoring(weight_mode=args.weight_mode)
@@ -17,16 +17,20 @@
   total_score (원점수, 0~100)
   total_score_adjusted (경고 기반 소폭 감쇄 적용, 선택)
   breakdown (A/B/C/D)
-  warnings (리스트)
+  warnings (리스트, score_dataframe은 세미콜론 문자열 + warnings_mask 비트마스크)
   mode (적용 가중치 시나리오)
 """
 
 from __future__ import annotations
+import os
 import re
-from dataclasses import dataclass
+from calendar import monthrange
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
 
 # =========================
 # 설정: 최대값 & 가중치 시나리오
@@ -45,6 +49,14 @@ WEIGHTS: Dict[str, Dict[str, float]] = {
     "late_stage": {"A": 0.45, "B": 0.20, "C": 0.15, "D": 0.20},
 }
 
+# 하드룰 0점 대상 진행상태
+_TERMINAL_STATUSES = frozenset({"모집완료", "종료"})
+
+# 합산용 (A, B, C, D) 튜플 — 행마다 문자열 키로 dict를 조회하지 않도록 미리 변환
+WEIGHTS_TUP: Dict[str, tuple] = {k: (v["A"], v["B"], v["C"], v["D"]) for k, v in WEIGHTS.items()}
+MAXES_TUP = (MAXES["A"], MAXES["B"], MAXES["C"], MAXES["D"])
+assert all(MAXES_TUP), "MAXES는 0이 될 수 없음"
+
 # =========================
 # 유틸
 # =========================
@@ -58,32 +70,72 @@ def _safe_int(x: Any, default: int = 0) -> int:
     except Exception:
         return default
 
+_PERIOD_PATTERN = r'(\d{4})년\s*(\d{1,2})월'
+
+# 행마다 쓰는 정규식은 미리 컴파일 (re 모듈 캐시 조회도 생략)
+_PERIOD_RE = re.compile(_PERIOD_PATTERN)
+_DIGIT_RE = re.compile(r'\d')
+_NUMBER_RE = re.compile(r'\d+')
+
+@lru_cache(maxsize=200_000)
 def parse_period(period_str: str):
-    """'YYYY년 M월 ~ YYYY년 M월' → (start_date, end_date) or (None, None)"""
-    m = re.findall(r'(\d{4})년\s*(\d{1,2})월', str(period_str or ""))
+    """
+    'YYYY년 M월 ~ YYYY년 M월' → (start_date, end_date) or (None, None)
+    - 같은 기간 문자열이 행마다 반복되므로 원문 문자열 기준으로 캐시 (호출부에서 str 변환)
+    """
+    m = _PERIOD_RE.findall(period_str)
     if len(m) >= 2:
         s = datetime(int(m[0][0]), int(m[0][1]), 1)
         e = datetime(int(m[1][0]), int(m[1][1]), 1)
         return s, e
     return None, None
 
+@lru_cache(maxsize=200_000)
 def months_between(period_str: str) -> int:
     s, e = parse_period(period_str)
     if s and e:
         return (e.year - s.year) * 12 + (e.month - s.month)
     return -1  # 파싱 실패
 
+def _add_months(dt: datetime, months: int) -> datetime:
+    """dt에 months개월 더하기 (일자는 해당 월 말일로 보정)"""
+    y, m = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+    return dt.replace(year=y, month=m + 1, day=min(dt.day, monthrange(y, m + 1)[1]))
+
+def whole_months_between(start: datetime, end: datetime) -> int:
+    """
+    start → end 사이의 경과 개월 수(0 방향 내림).
+    relativedelta(end, start)의 years * 12 + months와 동일 (말일 보정 포함)
+    """
+    months = (end.year - start.year) * 12 + (end.month - start.month)
+    if end >= start:
+        while end < _add_months(start, months):
+            months -= 1
+    else:
+        while end > _add_months(start, months):
+            months += 1
+    return months
+
 # =========================
 # 경고(무결성) 생성
 # =========================
 
 def build_warnings(row: Dict[str, Any], now: Optional[datetime] = None) -> List[str]:
     """타임스탬프 없이도 잡아낼 수 있는 데이터/논리 이상 경고."""
+    return _warnings_prepared(
+        (row.get("진행상태") or "").strip(),
+        row.get("임상시험 기간"),
+        row.get("목표 대상자 수(국내)", ""),
+        row.get("대상질환명", ""),
+        now,
+    )
+
+def _warnings_prepared(status: str, period: Any, target: Any, disease: Any, now: Optional[datetime]) -> List[str]:
+    """build_warnings 본체 (행 dict 대신 필요한 값만 위치 인자로 받음, status는 strip된 값)"""
     now = now or datetime.now()
     warns: List[str] = []
 
-    status = (row.get("진행상태") or "").strip()
-    start, end = parse_period(row.get("임상시험 기간"))
+    start, end = parse_period(str(period or ""))
 
     # 1) 기간 무결성
     if not start or not end or (end <= start):
@@ -99,12 +151,12 @@ def build_warnings(row: Dict[str, Any], now: Optional[datetime] = None) -> List[
             warns.append("RECRUITMENT_OVERDUE_AFTER_END")
 
     # 3) 목표 인원 파싱
-    tgt = str(row.get("목표 대상자 수(국내)", "")).replace(",", "")
-    if not re.search(r'\d', tgt):
+    tgt = str(target).replace(",", "")
+    if not _DIGIT_RE.search(tgt):
         warns.append("TARGET_MISSING_OR_NONNUMERIC")
 
     # 4) 질환 정보밀도
-    disease = str(row.get("대상질환명", "")).strip()
+    disease = str(disease).strip()
     if len(disease) < 6 or len(disease.split()) == 1:
         warns.append("DISEASE_GENERIC_INFO")
 
@@ -123,6 +175,7 @@ def apply_adjustment(total_raw: float, warnings: List[str]) -> float:
 # =========================
 
 # --- A: 상태/중요도 (0~30)
+@lru_cache(maxsize=65536)
 def calculate_status_and_importance(status: str, phase: str) -> int:
     score = 0
     status = (status or "").strip()
@@ -155,7 +208,7 @@ def pressure_score_continuous(spm: float) -> float:
 
 def calculate_recruitment_pressure(target_subjects: Any, period_str: str) -> int:
     target = _safe_int(target_subjects, 0)
-    months = months_between(period_str)
+    months = months_between(str(period_str or ""))
 
     if months <= 0:
         # 기간 파싱 실패/0개월: 보수적 24개월 가정, 연속형 점수 산출
@@ -166,29 +219,41 @@ def calculate_recruitment_pressure(target_subjects: Any, period_str: str) -> int
     return int(round(pressure_score_continuous(spm)))
 
 # --- C: 모집 난이도 (0~25) + 보너스(최대 +5 내)
+CANCER_KWS = ["암", "종양", "malign", "cancer", "oncology", "희귀"]
 RARE_KWS = ["희귀", "rare", "orphan"]
 NEURO_IMMUNE_KWS = ["신경", "neurolog", "면역", "immun"]
 FIH_KWS = ["first-in-human", "fih", "최초 인체", "초회 인체"]
 
+def _keyword_re(keywords: List[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+# 키워드 목록별 정규식 (호출마다 목록을 순회하지 않고 search 한 번으로 판정)
+_CANCER_RE = _keyword_re(CANCER_KWS)
+_RARE_RE = _keyword_re(RARE_KWS)
+_NEURO_IMMUNE_RE = _keyword_re(NEURO_IMMUNE_KWS)
+_FIH_RE = _keyword_re(FIH_KWS)
+
+@lru_cache(maxsize=65536)
 def difficulty_base(disease_name: str) -> int:
-    dn = (disease_name or "").lower()
-    if any(k in dn for k in ["암", "종양", "malign", "cancer", "oncology", "희귀"]):
+    dn = disease_name or ""
+    if _CANCER_RE.search(dn):
         return 15
-    if any(k in dn for k in ["신경", "neurolog", "면역", "immun"]):
+    if _NEURO_IMMUNE_RE.search(dn):
         return 10
     return 5
 
 def difficulty_bonus(disease_name: str, phase: str) -> int:
-    dn = (disease_name or "").lower()
+    dn = disease_name or ""
     bonus = 0
-    if any(k in dn for k in RARE_KWS):
+    if _RARE_RE.search(dn):
         bonus += 3
-    if any(k in dn for k in NEURO_IMMUNE_KWS):
+    if _NEURO_IMMUNE_RE.search(dn):
         bonus += 2
-    if "1상" in str(phase) and any(k in dn for k in FIH_KWS):
+    if "1상" in str(phase) and _FIH_RE.search(dn):
         bonus += 5  # 전략적 1상(FIH) 상향
     return min(bonus, 5)
 
+@lru_cache(maxsize=65536)
 def calculate_recruitment_difficulty(disease_name: str, gender: str, age_str: str, phase: str) -> int:
     score = difficulty_base(disease_name)
     score += difficulty_bonus(disease_name, phase)
@@ -198,7 +263,7 @@ def calculate_recruitment_difficulty(disease_name: str, gender: str, age_str: st
     if (has_m and not has_f) or (has_f and not has_m):
         score += 5  # 단일 성별 제한
 
-    nums = [int(n) for n in re.findall(r'\d+', str(age_str or ""))]
+    nums = [int(n) for n in _NUMBER_RE.findall(str(age_str or ""))]
     if len(nums) >= 2:
         lo, hi = nums[0], nums[1]
         if hi - lo <= 30:
@@ -213,8 +278,14 @@ def calculate_time_sensitivity(
     approval_date_str: str,
     current_date: Optional[datetime] = None,
 ) -> int:
-    now = current_date or datetime.now()
-
+    # 기준 시각을 캐시 키에 포함 (current_date 고정 시 같은 입력 조합은 재계산 없음).
+    # current_date 없이 호출하면 매번 시각이 달라 캐시가 적중하지 않으므로 캐시를 거치지 않음
+    if current_date is None:
+        return _time_sensitivity.__wrapped__(status, str(period_str or ""), approval_date_str, datetime.now())
+    return _time_sensitivity(status, str(period_str or ""), approval_date_str, current_date)
+
+@lru_cache(maxsize=65536)
+def _time_sensitivity(status: str, period_str: str, approval_date_str: str, now: datetime) -> int:
     start_date, end_date = parse_period(period_str)
     if not start_date or not end_date:
         return 5  # 안전 기본값
@@ -241,8 +312,7 @@ def calculate_time_sensitivity(
                 approval_date = None
 
             if approval_date:
-                rd = relativedelta(now, approval_date)
-                months_since_approval = rd.years * 12 + rd.months
+                months_since_approval = whole_months_between(approval_date, now)
             else:
                 months_since_approval = 0
 
@@ -264,30 +334,36 @@ def calculate_time_sensitivity(
 
     return 0
 
+def clear_score_caches():
+    """스칼라 스코어링 함수들의 lru_cache 비우기 (장시간 실행 서비스에서 기준일이 바뀔 때 등)"""
+    for fn in (
+        parse_period, months_between, calculate_status_and_importance,
+        difficulty_base, calculate_recruitment_difficulty, _time_sensitivity,
+    ):
+        fn.cache_clear()
+
 # =========================
 # 통합 계산
 # =========================
 
-@dataclass
-class ScoreBreakdown:
-    A: int
-    B: int
-    C: int
-    D: int
-
-def _combine_with_weights(bd: ScoreBreakdown, weights: Dict[str, float]) -> float:
-    a = bd.A / MAXES["A"] if MAXES["A"] else 0
-    b = bd.B / MAXES["B"] if MAXES["B"] else 0
-    c = bd.C / MAXES["C"] if MAXES["C"] else 0
-    d = bd.D / MAXES["D"] if MAXES["D"] else 0
-    score = 100.0 * (weights["A"] * a + weights["B"] * b + weights["C"] * c + weights["D"] * d)
-    return float(_clamp(score, 0, 100))
+# (A, B, C, D) 점수 묶음 — 행마다 바로 소비되므로 객체 대신 튜플
+ScoreBreakdown = Tuple[int, int, int, int]
+
+def _combine_with_weights(bd: ScoreBreakdown, weights: tuple) -> float:
+    """weights: WEIGHTS_TUP의 (wA, wB, wC, wD)"""
+    A, B, C, D = bd
+    wA, wB, wC, wD = weights
+    mA, mB, mC, mD = MAXES_TUP
+    score = 100.0 * (wA * (A / mA) + wB * (B / mB) + wC * (C / mC) + wD * (D / mD))
+    # 행마다 호출되므로 _clamp 함수 호출 대신 인라인 비교
+    return 0.0 if score < 0 else (100.0 if score > 100 else score)
 
 def calculate_total_urgency_score(
     trial_data: Dict[str, Any],
     mode: str = "baseline",
     current_date: Optional[datetime] = None,
     with_adjustment: bool = True,
+    compute_warnings: bool = True,
 ) -> Dict[str, Any]:
     """
     단일 과제의 최종 시급성 점수 계산.
@@ -295,12 +371,44 @@ def calculate_total_urgency_score(
             "auto" → 진행상태 '승인완료'면 late_stage, '모집중'이면 speed
     - 모집완료/종료: 하드룰 0점 (경고는 함께 반환)
     - with_adjustment: warnings 기반 소폭 감쇄 적용 여부
+    - compute_warnings=False: 반환 warnings는 빈 리스트 (with_adjustment=False면 경고 계산도 생략)
     """
-    status = (trial_data.get("진행상태") or "").strip()
-    warnings = build_warnings(trial_data, now=current_date)
+    # 행 dict 조회는 여기서 한 번만 하고 이후는 지역 변수로 계산
+    # (목표 인원 기본값 None: B 점수는 0, 경고는 '누락'으로 처리 — 키가 없을 때 기존 동작과 동일)
+    get = trial_data.get
+    return _score_prepared(
+        (get("진행상태") or "").strip(),
+        get("임상시험 단계", ""),
+        get("임상시험 기간", ""),
+        get("목표 대상자 수(국내)"),
+        get("대상질환명", ""),
+        get("성별", ""),
+        get("나이", ""),
+        get("임상시험 승인일자", ""),
+        mode,
+        current_date,
+        with_adjustment,
+        compute_warnings,
+    )
 
+def _score_prepared(
+    status: str,
+    phase: Any,
+    period: Any,
+    target: Any,
+    disease: Any,
+    gender: Any,
+    age: Any,
+    approval: Any,
+    mode: str,
+    current_date: Optional[datetime],
+    with_adjustment: bool,
+    compute_warnings: bool = True,
+) -> Dict[str, Any]:
+    """calculate_total_urgency_score 본체 (컬럼 값을 위치 인자로 받음, status는 strip된 값)"""
     # 하드룰: 모집완료/종료는 즉시 0
-    if status in {"모집완료", "종료"}:
+    if status in _TERMINAL_STATUSES:
+        warnings = _warnings_prepared(status, period, target, disease, current_date) if compute_warnings else []
         out = {
             "total_score": 0.0,
             "total_score_adjusted": 0.0 if with_adjustment else 0.0,
@@ -311,31 +419,33 @@ def calculate_total_urgency_score(
         return out
 
     # A~D 산출
-    A = calculate_status_and_importance(status, trial_data.get("임상시험 단계", ""))
-    B = calculate_recruitment_pressure(trial_data.get("목표 대상자 수(국내)", 0), trial_data.get("임상시험 기간", ""))
-    C = calculate_recruitment_difficulty(
-        trial_data.get("대상질환명", ""), trial_data.get("성별", ""), trial_data.get("나이", ""), trial_data.get("임상시험 단계", "")
-    )
-    D = calculate_time_sensitivity(status, trial_data.get("임상시험 기간", ""), trial_data.get("임상시험 승인일자", ""), current_date=current_date)
-    bd = ScoreBreakdown(A, B, C, D)
+    A = calculate_status_and_importance(status, phase)
+    B = calculate_recruitment_pressure(target, period)
+    C = calculate_recruitment_difficulty(disease, gender, age, phase)
+    D = calculate_time_sensitivity(status, period, approval, current_date=current_date)
 
     # 상태 기반 자동 시나리오 전환
     selected_mode = mode
     if mode == "auto":
         selected_mode = "late_stage" if status == "승인완료" else "speed"
 
-    weights = WEIGHTS.get(selected_mode, WEIGHTS["baseline"])
-    total_raw = round(_combine_with_weights(bd, weights), 1)
+    weights = WEIGHTS_TUP.get(selected_mode, WEIGHTS_TUP["baseline"])
+    total_raw = round(_combine_with_weights((A, B, C, D), weights), 1)
+    warnings: List[str] = []
+    if compute_warnings or with_adjustment:
+        warnings = _warnings_prepared(status, period, target, disease, current_date)
     total_adj = apply_adjustment(total_raw, warnings) if with_adjustment else total_raw
+    if not compute_warnings:
+        warnings = []
 
     return {
         "total_score": total_raw,
         "total_score_adjusted": total_adj,
         "breakdown": {
-            "1_상태_및_중요도": bd.A,
-            "2_모집_압박_강도": bd.B,
-            "3_모집_난이도": bd.C,
-            "4_시간적_민감도": bd.D,
+            "1_상태_및_중요도": A,
+            "2_모집_압박_강도": B,
+            "3_모집_난이도": C,
+            "4_시간적_민감도": D,
         },
         "warnings": warnings,
         "mode": selected_mode,
@@ -345,36 +455,369 @@ def calculate_total_urgency_score(
 # DataFrame 일괄 계산 헬퍼 (선택)
 # =========================
 
-def score_dataframe(df, mode: str = "baseline", current_date: Optional[datetime] = None, with_adjustment: bool = True):
+# 커널 입력용 진행상태 코드
+_ST_RECRUITING, _ST_APPROVED, _ST_RECRUITED, _ST_CLOSED, _ST_OTHER = 0, 1, 2, 3, 4
+
+# 질환명 키워드 플래그(bit)
+_DF_CANCER, _DF_NEURO_IMMUNE, _DF_RARE, _DF_FIH = 1, 2, 4, 8
+
+# build_warnings와 같은 순서의 경고 코드 (bit i ↔ _WARNING_NAMES[i])
+_WARNING_NAMES = (
+    "PERIOD_INVALID",
+    "IMPOSSIBLE_STATUS_RECRUITED_BEFORE_START",
+    "STATUS_STUCK_POST_START",
+    "RECRUITMENT_OVERDUE_AFTER_END",
+    "TARGET_MISSING_OR_NONNUMERIC",
+    "DISEASE_GENERIC_INFO",
+)
+
+# 경고 이름 → 비트 (score_dataframe의 warnings_mask 컬럼 해석용)
+_WARNING_BITS = {name: 1 << i for i, name in enumerate(_WARNING_NAMES)}
+
+def warnings_to_str(mask: int) -> str:
+    """warnings_mask 값 → 세미콜론 구분 경고 문자열 (build_warnings 순서)"""
+    mask = int(mask)
+    return ";".join(name for name, bit in _WARNING_BITS.items() if mask & bit)
+
+def count_warning_bits(mask: np.ndarray) -> np.ndarray:
+    """warnings_mask 배열 → 행별 경고 개수"""
+    mask = np.asarray(mask, dtype=np.int64)
+    n = np.zeros(mask.shape, dtype=np.int64)
+    for bit in _WARNING_BITS.values():
+        n += (mask & bit) > 0
+    return n
+
+_US_PER_DAY = 86_400_000_000
+
+def _map_unique(values, func, dtype=None) -> np.ndarray:
+    """고유값마다 한 번만 func을 호출해 전체 길이 배열로 펼침 (반복 값이 많은 컬럼용)"""
+    import pandas as pd
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    mapped = np.array([func(u) for u in uniques], dtype=dtype)
+    if len(mapped) == 0:
+        return np.zeros((0,) + mapped.shape[1:], dtype=mapped.dtype)
+    return mapped[codes]
+
+def _round1(x: np.ndarray) -> np.ndarray:
+    """Python round(v, 1)과 동일한 반올림 (np.round는 경계값에서 다를 수 있음). 고유값 단위로 적용"""
+    uniq, inv = np.unique(x, return_inverse=True)
+    return np.array([round(float(v), 1) for v in uniq], dtype=np.float64)[inv.reshape(x.shape)]
+
+def _disease_flags(disease) -> np.ndarray:
+    """질환명 컬럼 → 키워드 플래그 비트 배열. 고유 질환명에 정규식별 str.contains를 한 번씩 적용"""
+    import pandas as pd
+    codes, uniques = pd.factorize(disease)
+    names = pd.Series(uniques, dtype=object)
+    flags = np.zeros(len(uniques), dtype=np.int64)
+    for bit, pattern in (
+        (_DF_CANCER, _CANCER_RE), (_DF_NEURO_IMMUNE, _NEURO_IMMUNE_RE), (_DF_RARE, _RARE_RE), (_DF_FIH, _FIH_RE)
+    ):
+        flags |= np.where(names.str.contains(pattern, na=False).to_numpy(dtype=bool), bit, 0)
+    return flags[codes]
+
+def _disease_generic(value) -> bool:
+    disease = str(value).strip()
+    return len(disease) < 6 or len(disease.split()) == 1
+
+def _months_since_approval(approval, now: datetime) -> np.ndarray:
     """
-    pandas.DataFrame 각 행에 점수 계산 → A/B/C/D, total_score, total_score_adjusted, warnings, mode 컬럼 추가
+    승인일자 컬럼 → now까지 경과 개월 수 배열 (whole_months_between과 동일, 파싱 실패는 0).
+    고유 문자열만 pd.to_datetime(format=...)으로 한 번에 파싱 (strptime과 같은 값만 인정) 후 codes로 펼침
     """
     import pandas as pd
-    rows = []
-    for _, row in df.iterrows():
-        data = {
-            "진행상태": row.get("진행상태", ""),
-            "임상시험 단계": row.get("임상시험 단계", ""),
-            "임상시험 기간": row.get("임상시험 기간", ""),
-            "목표 대상자 수(국내)": row.get("목표 대상자 수(국내)", 0),
-            "대상질환명": row.get("대상질환명", ""),
-            "성별": row.get("성별", ""),
-            "나이": row.get("나이", ""),
-            "임상시험 승인일자": row.get("임상시험 승인일자", ""),
-        }
-        res = calculate_total_urgency_score(data, mode=mode, current_date=current_date, with_adjustment=with_adjustment)
-        rows.append({
-            "A": res["breakdown"]["1_상태_및_중요도"],
-            "B": res["breakdown"]["2_모집_압박_강도"],
-            "C": res["breakdown"]["3_모집_난이도"],
-            "D": res["breakdown"]["4_시간적_민감도"],
-            "total_score": res["total_score"],
-            "total_score_adjusted": res["total_score_adjusted"],
-            "warnings": ";".join(res["warnings"]),
-            "mode": res["mode"],
-        })
+    codes, uniques = pd.factorize(approval.fillna("").astype(str).str.strip())
+    dates = pd.to_datetime(pd.Series(uniques, dtype=object), format="%Y-%m-%d", errors="coerce")
+    valid = dates.notna().to_numpy()
+    ay = dates.dt.year.fillna(0).to_numpy(dtype=np.int64)
+    am = dates.dt.month.fillna(0).to_numpy(dtype=np.int64)
+    ad = dates.dt.day.fillna(0).to_numpy(dtype=np.int64)
+
+    months = (now.year - ay) * 12 + (now.month - am)
+    # approval + months는 항상 now와 같은 달 → 그 달의 (말일 보정된) 같은 일자 자정과 비교해 ±1 보정
+    same_day = np.minimum(ad, monthrange(now.year, now.month)[1])
+    now_after_midnight = now.time() != datetime.min.time()
+    forward = (ay < now.year) | ((ay == now.year) & ((am < now.month) | ((am == now.month) & (ad <= now.day))))
+    months = np.where(forward & (now.day < same_day), months - 1, months)
+    months = np.where(
+        ~forward & ((now.day > same_day) | ((now.day == same_day) & now_after_midnight)), months + 1, months
+    )
+    return np.where(valid, months, 0)[codes]
+
+def _encode_frame(df, now: datetime) -> Dict[str, np.ndarray]:
+    """
+    DataFrame → 스코어링 커널 입력용 numpy 배열 묶음(SoA).
+    문자열 파싱(진행상태/단계/성별/기간/목표인원/질환 키워드)은 고유값마다 한 번만 수행.
+    """
+    import pandas as pd
+
+    def col(name, default=""):
+        if name in df.columns:
+            s = df[name]
+            # 카테고리형 컬럼은 fillna("") 등 문자열 처리를 위해 일반 값으로 풀어서 사용
+            return s.astype(object) if isinstance(s.dtype, pd.CategoricalDtype) else s
+        return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+    def text_codes(name, default=""):
+        """
+        반복 값이 많은 문자열 컬럼 → (codes, 고유값 문자열 Series).
+        category로 한 번 인코딩한 뒤 문자열 처리는 고유값에만 하고 codes로 펼침.
+        NaN(code -1)은 마지막에 덧붙인 ""를 가리킴.
+        """
+        s = df[name] if name in df.columns else pd.Series([default] * len(df), index=df.index, dtype=object)
+        cat = s.array if isinstance(s.dtype, pd.CategoricalDtype) else pd.Categorical(s)
+        values = pd.Series([*cat.categories.astype(object), ""], dtype=object).astype(str)
+        return np.asarray(cat.codes), values
+
+    status_codes, status = text_codes("진행상태")
+    status = status.str.strip()
+    phase_codes, phase = text_codes("임상시험 단계")
+    gender_codes, gender = text_codes("성별")
+
+    status_code = np.select(
+        [status.eq("모집중"), status.eq("승인완료"), status.eq("모집완료"), status.eq("종료")],
+        [_ST_RECRUITING, _ST_APPROVED, _ST_RECRUITED, _ST_CLOSED],
+        default=_ST_OTHER,
+    ).astype(np.int8)[status_codes]
+
+    phase_pts = np.select(
+        [phase.str.contains(k, regex=False).to_numpy(dtype=bool) for k in ("3상", "2상", "1상", "생동")],
+        [15, 10, 5, 3],
+        default=0,
+    ).astype(np.int64)[phase_codes]
+
+    # 기간: 고유 문자열에 extractall 한 번 → 첫/두 번째 'YYYY년 M월'을 시작/종료로 사용 (parse_period와 동일)
+    period_codes, period_uniques = pd.factorize(col("임상시험 기간").fillna("").astype(str))
+    pairs = pd.Series(period_uniques, dtype=object).str.extractall(_PERIOD_PATTERN)
+    pairs = pairs[pairs.index.get_level_values("match") < 2].astype("float64").unstack("match")
+    pairs = pairs.reindex(index=range(len(period_uniques)), columns=pd.MultiIndex.from_product([[0, 1], [0, 1]]))
+    ym = pairs.to_numpy()[period_codes].reshape(-1, 4)
+    period_ok = ~np.isnan(ym).any(axis=1)
+    period_ok &= (ym[:, 0] >= 1) & (ym[:, 1] >= 1) & (ym[:, 2] >= 1) & (ym[:, 2] <= 12) & (ym[:, 3] >= 1) & (ym[:, 3] <= 12)
+    sy = np.where(period_ok, ym[:, 0], 1970).astype(np.int64)
+    ey = np.where(period_ok, ym[:, 1], 1970).astype(np.int64)
+    sm = np.where(period_ok, ym[:, 2], 1).astype(np.int64)
+    em = np.where(period_ok, ym[:, 3], 1).astype(np.int64)
+    start_us = ((sy - 1970) * 12 + (sm - 1)).astype("datetime64[M]").astype("datetime64[us]").astype(np.int64)
+    end_us = ((ey - 1970) * 12 + (em - 1)).astype("datetime64[M]").astype("datetime64[us]").astype(np.int64)
+    period_months = np.where(period_ok, (ey - sy) * 12 + (em - sm), -1)
+
+    # 목표 인원: _safe_int와 동일하게 정수 문자열만 인정, 나머지는 0
+    target_codes, target_str = text_codes("목표 대상자 수(국내)", 0)
+    target_str = target_str.str.replace(",", "", regex=False)
+    target_int = target_str.str.strip().where(target_str.str.strip().str.fullmatch(r"[+-]?\d+", na=False))
+    target = pd.to_numeric(target_int, errors="coerce").fillna(0).to_numpy(dtype=np.int64)[target_codes]
+
+    age_nums = col("나이").map(lambda v: str(v or "")).str.extract(r'(\d+)\D+(\d+)')
+    age_lo = pd.to_numeric(age_nums[0], errors="coerce").to_numpy(dtype=np.float64)
+    age_hi = pd.to_numeric(age_nums[1], errors="coerce").to_numpy(dtype=np.float64)
+
+    return {
+        "status_code": status_code,
+        "phase_pts": phase_pts,
+        "phase_1": phase.str.contains("1상", regex=False).to_numpy(dtype=bool)[phase_codes],
+        "target": target,
+        "target_missing": ~target_str.str.contains(r"\d", na=False).to_numpy(dtype=bool)[target_codes],
+        "period_ok": period_ok,
+        "period_months": period_months,
+        "start_us": start_us,
+        "end_us": end_us,
+        "approval_months": _months_since_approval(col("임상시험 승인일자"), now),
+        "disease_flags": _disease_flags(col("대상질환명").fillna("").astype(str)),
+        "disease_generic": _map_unique(col("대상질환명"), _disease_generic, dtype=bool),
+        "single_sex": (
+            gender.str.contains("남", regex=False) ^ gender.str.contains("여", regex=False)
+        ).to_numpy(dtype=bool)[gender_codes],
+        "narrow_age": (age_hi - age_lo) <= 30,
+    }
+
+def _vec_status_and_importance(status_code: np.ndarray, phase_pts: np.ndarray) -> np.ndarray:
+    """calculate_status_and_importance의 배열 버전"""
+    status_pts = np.select([status_code == _ST_RECRUITING, status_code == _ST_APPROVED], [15, 10], default=0)
+    return np.clip(status_pts + phase_pts, 0, MAXES["A"])
+
+def _vec_recruitment_pressure(target: np.ndarray, period_months: np.ndarray) -> np.ndarray:
+    """calculate_recruitment_pressure의 배열 버전 (기간 파싱 실패/0개월 이하 → 24개월 가정)"""
+    months = np.where(period_months <= 0, 24.0, period_months)
+    spm = target / months
+    np.clip(spm, 0, 10, out=spm)
+    return np.rint(5 + (spm / 10.0) * 20).astype(np.int64)
+
+def _vec_recruitment_difficulty(
+    disease_flags: np.ndarray, phase_1: np.ndarray, single_sex: np.ndarray, narrow_age: np.ndarray
+) -> np.ndarray:
+    """calculate_recruitment_difficulty의 배열 버전 (질환 키워드는 _disease_flags 비트로 전달)"""
+    base = np.select([disease_flags & _DF_CANCER > 0, disease_flags & _DF_NEURO_IMMUNE > 0], [15, 10], default=5)
+    bonus = (
+        np.where(disease_flags & _DF_RARE, 3, 0)
+        + np.where(disease_flags & _DF_NEURO_IMMUNE, 2, 0)
+        + np.where(phase_1 & (disease_flags & _DF_FIH > 0), 5, 0)
+    )
+    score = base + np.minimum(bonus, 5) + np.where(single_sex, 5, 0) + np.where(narrow_age, 5, 0)
+    return np.clip(score, 0, MAXES["C"])
+
+def _vec_time_sensitivity(
+    status_code: np.ndarray,
+    period_ok: np.ndarray,
+    start_us: np.ndarray,
+    end_us: np.ndarray,
+    approval_months: np.ndarray,
+    now_us: int,
+) -> np.ndarray:
+    """calculate_time_sensitivity의 배열 버전 (기간 시작/종료는 epoch 마이크로초)"""
+    recruiting = status_code == _ST_RECRUITING
+    approved = status_code == _ST_APPROVED
+    total_days = np.maximum(1, (end_us - start_us) // _US_PER_DAY)
+    elapsed = (now_us - start_us) // _US_PER_DAY
+    progress_ratio = elapsed / total_days
+    days_to_start = (start_us - now_us) // _US_PER_DAY
+    delayed = approved & (now_us > start_us)
+    upcoming = approved & ~delayed
+    # 스칼라 버전의 분기를 위에서부터 순서대로 평가 (처음 맞는 조건의 점수)
+    return np.select(
+        [
+            ~period_ok,
+            recruiting & (progress_ratio >= 0.5),
+            recruiting & (progress_ratio >= 0.25),
+            recruiting,
+            delayed & (approval_months > 6),
+            delayed & (approval_months >= 3),
+            delayed,
+            upcoming & (days_to_start <= 30),
+            upcoming & (days_to_start <= 90),
+            upcoming,
+        ],
+        [5, 20, 15, 10, 15, 10, 5, 15, 10, 5],
+        default=0,
+    )
+
+def _vec_warnings(enc: Dict[str, np.ndarray], now_us: int) -> np.ndarray:
+    """build_warnings의 배열 버전 → 경고 비트마스크 (bit i ↔ _WARNING_NAMES[i])"""
+    st = enc["status_code"]
+    period_ok = enc["period_ok"]
+    start_us, end_us = enc["start_us"], enc["end_us"]
+    conds = (
+        ~period_ok | (end_us <= start_us),
+        period_ok & (st == _ST_RECRUITED) & (now_us < start_us),
+        period_ok & (st == _ST_APPROVED) & (now_us >= start_us),
+        period_ok & (st == _ST_RECRUITING) & (now_us > end_us),
+        enc["target_missing"],
+        enc["disease_generic"],
+    )
+    warn = np.zeros(len(st), dtype=np.int64)
+    for bit, cond in enumerate(conds):
+        warn |= cond.astype(np.int64) << bit
+    return warn
+
+def _now_us(now: datetime) -> int:
+    return int(np.datetime64(now, "us").astype(np.int64))
+
+def _score_arrays(enc: Dict[str, np.ndarray], now: datetime, with_warnings: bool = True):
+    """인코딩된 배열로 A/B/C/D와 경고 비트마스크를 행 루프 없이 한 번에 계산 (with_warnings=False면 경고는 None)"""
+    now_us = _now_us(now)
+    A = _vec_status_and_importance(enc["status_code"], enc["phase_pts"])
+    B = _vec_recruitment_pressure(enc["target"], enc["period_months"])
+    C = _vec_recruitment_difficulty(enc["disease_flags"], enc["phase_1"], enc["single_sex"], enc["narrow_age"])
+    D = _vec_time_sensitivity(
+        enc["status_code"], enc["period_ok"], enc["start_us"], enc["end_us"], enc["approval_months"], now_us
+    )
+    return A, B, C, D, _vec_warnings(enc, now_us) if with_warnings else None
+
+def _pick_score_arrays(n_rows: int):
+    """numba가 설치돼 있고 행 수가 충분히 크면 score_numba 커널, 아니면 NumPy 경로"""
+    try:
+        from scoring import score_numba
+    except ImportError:
+        return _score_arrays
+    if score_numba.NUMBA_AVAILABLE and n_rows >= score_numba.NUMBA_MIN_ROWS:
+        return score_numba.score_arrays
+    return _score_arrays
+
+# 이 행 수 미만이면 workers를 지정해도 프로세스 풀을 쓰지 않음 (프로세스 기동/직렬화 비용이 더 큼)
+PARALLEL_MIN_ROWS = 5000
+
+def score_dataframe(
+    df,
+    mode: str = "baseline",
+    current_date: Optional[datetime] = None,
+    with_adjustment: bool = True,
+    workers: Optional[int] = 1,
+    with_warnings: bool = True,
+):
+    """
+    pandas.DataFrame 각 행에 점수 계산 → A/B/C/D, total_score, total_score_adjusted, warnings, warnings_mask, mode 컬럼 추가
+    - 행마다 calculate_total_urgency_score를 부르지 않고, 컬럼을 배열로 인코딩한 뒤 한 번에 계산
+      (결과는 행 단위 계산과 동일)
+    - numba가 있으면 NUMBA_MIN_ROWS 이상에서 score_numba 커널 사용
+    - workers > 1(None이면 CPU 수)이고 PARALLEL_MIN_ROWS 이상이면 행 묶음을 프로세스 풀로 나눠 계산
+    - with_warnings=False면 warnings/warnings_mask 컬럼을 만들지 않음
+      (with_adjustment=False까지 함께 주면 경고 계산 자체를 생략)
+    """
+    now = current_date or datetime.now()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(df) < PARALLEL_MIN_ROWS:
+        return _score_chunk(df, mode, now, with_adjustment, with_warnings)
+
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor
+    # 행끼리 독립이므로 연속 구간으로 나눠 계산 후 원래 순서(인덱스 유지)대로 이어 붙임
+    bounds = np.linspace(0, len(df), workers + 1).astype(int)
+    chunks = [df.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(
+            _score_chunk, chunks, repeat(mode), repeat(now), repeat(with_adjustment), repeat(with_warnings)
+        ))
+    out = pd.concat(parts)
+    # 묶음마다 카테고리 구성이 달라 concat 후 object가 되므로 다시 category로
+    out["mode"] = out["mode"].astype("category")
+    return out
+
+def _score_chunk(df, mode: str, now: datetime, with_adjustment: bool, with_warnings: bool = True):
+    """score_dataframe의 단일 프로세스 계산 (프로세스 풀 작업 단위)"""
     import pandas as pd
-    aux = pd.DataFrame(rows, index=df.index)
+    enc = _encode_frame(df, now)
+    # 감쇄에도 경고 개수가 필요하므로 둘 다 꺼진 경우에만 경고 계산 생략
+    A, B, C, D, warn = _pick_score_arrays(len(df))(enc, now, with_warnings or with_adjustment)
+    st = enc["status_code"]
+    terminal = (st == _ST_RECRUITED) | (st == _ST_CLOSED)
+
+    # 상태 기반 자동 시나리오 전환
+    if mode == "auto":
+        approved = st == _ST_APPROVED
+        selected_mode = np.where(approved, "late_stage", "speed").astype(object)
+        wA, wB, wC, wD = (
+            np.where(approved, late, speed) for late, speed in zip(WEIGHTS_TUP["late_stage"], WEIGHTS_TUP["speed"])
+        )
+    else:
+        selected_mode = np.full(len(df), mode, dtype=object)
+        wA, wB, wC, wD = WEIGHTS_TUP.get(mode, WEIGHTS_TUP["baseline"])
+
+    mA, mB, mC, mD = MAXES_TUP
+    score = 100.0 * (wA * (A / mA) + wB * (B / mB) + wC * (C / mC) + wD * (D / mD))
+    total_raw = _round1(np.clip(score, 0, 100, out=score))
+
+    if with_adjustment:
+        n_warn = count_warning_bits(warn)
+        attenuation = np.minimum(0.15, 0.03 * n_warn)
+        total_adj = _round1(total_raw * (1.0 - attenuation))
+    else:
+        total_adj = total_raw
+
+    # 하드룰: 모집완료/종료는 0점
+    # A~D는 0~30 범위라 int16, mode는 값 종류가 적어 category로 (메모리/concat 비용 절감)
+    cols = {
+        "A": np.where(terminal, 0, A).astype(np.int16),
+        "B": np.where(terminal, 0, B).astype(np.int16),
+        "C": np.where(terminal, 0, C).astype(np.int16),
+        "D": np.where(terminal, 0, D).astype(np.int16),
+        "total_score": np.where(terminal, 0.0, total_raw),
+        "total_score_adjusted": np.where(terminal, 0.0, total_adj),
+    }
+    if with_warnings:
+        cols["warnings"] = _map_unique(warn, warnings_to_str, dtype=object)
+        cols["warnings_mask"] = warn.astype(np.uint16)
+    cols["mode"] = pd.Categorical(np.where(terminal, mode if mode != "auto" else "speed", selected_mode))
+    aux = pd.DataFrame(cols, index=df.index)
     return pd.concat([df, aux], axis=1)
 
 # =========================
@@ -391,10 +834,13 @@ if __name__ == "__main__":
         "나이": "18세 이상~65세 미만",
         "임상시험 승인일자": "2025-01-24",
     }
+    TEMPLATE = (
+        "🔬 임상시험 시급성 스코어\n"
+        "- total_score: {total_score}\n"
+        "- total_score_adjusted: {total_score_adjusted}\n"
+        "- breakdown: {breakdown}\n"
+        "- warnings: {warnings}\n"
+        "- mode: {mode}"
+    )
     res = calculate_total_urgency_score(example, mode="auto", with_adjustment=True)
-    print("🔬 임상시험 시급성 스코어")
-    print("- total_score:", res["total_score"])
-    print("- total_score_adjusted:", res["total_score_adjusted"])
-    print("- breakdown:", res["breakdown"])
-    print("- warnings:", res["warnings"])
-    print("- mode:", res["mode"])
+    print(TEMPLATE.format(**res))
@@ -25,15 +25,18 @@ def main():
     gc = gspread.authorize(creds)
     ws = gc.open_by_key(cfg['sheet_id']).worksheet(cfg['worksheet'])
     
+    # 헤더/2행과 A열(clncTestSn)을 batch_get 한 번으로 조회
+    top_rows, col_a = ws.batch_get(["1:2", "A:A"])
+    header = top_rows[0] if top_rows else []
+    row2 = top_rows[1] if len(top_rows) > 1 else []
+    
     # 1. 헤더 확인 (1행)
-    header = ws.row_values(1)
     print(f"📋 1행 (헤더): {len(header)}개 컬럼")
     for i, col in enumerate(header, 1):
         print(f"  {i:2d}. {col}")
     
     # 2. 최근 추가된 데이터 확인 (2행)
     print(f"\n📄 2행 (최근 데이터):")
-    row2 = ws.row_values(2)
     if row2:
         for i, (col_name, value) in enumerate(zip(header, row2), 1):
             display_value = value[:50] + "..." if len(value) > 50 else value
@@ -42,14 +45,19 @@ def main():
         print("  (빈 행)")
     
     # 3. 전체 행 수 확인
-    all_values = ws.get_all_values()
-    total_rows = len([row for row in all_values if any(cell.strip() for cell in row)])
+    # 시트 전체(get_all_values) 대신 키 컬럼 하나만 받아 값이 있는 셀 수로 계산
+    # (모든 데이터 행에는 clncTestSn이 있음, 없으면 A열 기준)
+    key_col_idx = header.index("clncTestSn") + 1 if "clncTestSn" in header else 1
+    if key_col_idx == 1:
+        key_values = [r[0] if r else "" for r in col_a]
+    else:
+        key_values = ws.col_values(key_col_idx)
+    total_rows = sum(1 for cell in key_values if cell.strip())
     print(f"\n📊 전체 데이터 행 수: {total_rows}행 (헤더 포함)")
     
     # 4. clncTestSn 컬럼의 최근 값들 확인
     if "clncTestSn" in header:
-        clnc_col_idx = header.index("clncTestSn")
-        clnc_values = ws.col_values(clnc_col_idx + 1)[1:6]  # 상위 5개
+        clnc_values = key_values[1:6]  # 상위 5개
         print(f"\n🔢 clncTestSn 최근 5개 값:")
         for i, sn in enumerate(clnc_values, 1):
             print(f"  {i}. {sn}")
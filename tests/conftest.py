@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가 (scoring/, pipeline/ 패키지 임포트용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline import clean_trials
+from pipeline.clean_trials import CORE_FIELDS, dummy_row_mask, looks_garbage_title, write_csv
+
+
+def _is_dummy_row_reference(row: pd.Series) -> bool:
+    """벡터화 이전의 행 단위 더미 판정 (비교 기준)"""
+    if looks_garbage_title(row.get("임상시험명", np.nan)):
+        return True
+    empty_core = sum(
+        1 for c in CORE_FIELDS
+        if (not isinstance(row.get(c), str)) or (str(row.get(c)).strip() == "")
+    )
+    if empty_core >= len(CORE_FIELDS):
+        return True
+    non_null = (
+        row.astype(str)
+           .replace({"nan": ""})
+           .str.strip()
+           .replace("", np.nan)
+           .notna()
+           .sum()
+    )
+    return non_null <= 3
+
+
+MISSING = [None, np.nan, pd.NA, "", "  ", "nan"]
+
+
+def _dummy_frames():
+    base = {"임상시험명": "시험 A", "임상시험 기간": "미정", "임상시험 단계": "1상"}
+    yield pd.DataFrame({**{k: [v] for k, v in base.items()}, "x": [None]}, dtype=object)
+    for miss in MISSING:
+        rows = [
+            {**base, "x": miss},
+            {**base, "임상시험 기간": "2024.01 ~ 2025.06", "x": miss},
+            {**base, "임상시험 승인일자": miss, "임상시험 의뢰자": "제약사", "x": "값"},
+            {"임상시험명": miss, "임상시험 단계": "2상", "임상시험 의뢰자": miss, "x": 1.5},
+            {**base, "임상시험 기간": miss, "x": miss, "y": miss},
+        ]
+        yield pd.DataFrame(rows, dtype=object)
+        yield pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("df", list(_dummy_frames()))
+def test_dummy_row_mask_matches_row_predicate(df, monkeypatch):
+    # process() 안에서 시작월/종료월 삽입 후 실제로 넘어오는 프레임으로 비교
+    seen = []
+
+    def checked(frame):
+        mask = dummy_row_mask(frame)
+        expected = frame.apply(_is_dummy_row_reference, axis=1)
+        assert mask.tolist() == expected.tolist()
+        seen.append(len(frame))
+        return mask
+
+    monkeypatch.setattr(clean_trials, "dummy_row_mask", checked)
+    clean_trials.process(df.copy())
+    assert seen == [len(df)]
+
+
+def test_write_csv_default_matches_to_csv(tmp_path):
+    # 기본값은 pyarrow 설치 여부와 관계없이 df.to_csv와 같은 바이트
+    df = pd.DataFrame({"임상시험명": ["x", "y,z"], "score": [97.0, 1.5]})
+    for encoding in ("utf-8", "utf-8-sig"):
+        out, expected = tmp_path / "out.csv", tmp_path / "expected.csv"
+        write_csv(df, str(out), encoding=encoding)
+        df.to_csv(expected, index=False, encoding=encoding)
+        assert out.read_bytes() == expected.read_bytes()
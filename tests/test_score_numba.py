@@ -0,0 +1,58 @@
+import itertools
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from scoring import score_numba, urgency_scoring
+
+# 각 분기를 지나도록 고른 컬럼 값 (모든 조합으로 DataFrame 구성)
+VALUES = {
+    "진행상태": ["모집중", "승인완료", "모집완료", "종료", "기타", None],
+    "임상시험 단계": ["1상", "2상", "3상", "생동", "연구자 임상시험"],
+    "임상시험 기간": [
+        "2024년 1월 ~ 2026년 12월",   # 진행 중 (진행률 ~50%)
+        "2025년 6월 ~ 2030년 6월",    # 진행 초기
+        "2025년 10월 ~ 2026년 3월",   # 곧 시작 (30일 이내)
+        "2025년 12월 ~ 2027년 1월",   # 시작 90일 이내
+        "2027년 1월 ~ 2028년 1월",    # 먼 미래
+        "2020년 1월 ~ 2021년 1월",    # 종료 지남
+        "2025년 13월 ~ 2026년 1월",   # 잘못된 월
+        "",
+    ],
+    "목표 대상자 수(국내)": ["120", "1,200", "", "abc", "-5"],
+    "대상질환명": ["비소세포폐암", "희귀 신경면역 질환, first-in-human", "rare orphan disease", "면역 질환", "감기"],
+    "성별": ["남", "■남 ■여", "여"],
+    "나이": ["18세~40세", "18세 이상~65세 미만", ""],
+    "임상시험 승인일자": ["2025-01-24", "2025-03-15", "2025-06-15", "2025-07-01", "2024-02-29", "x"],
+}
+
+
+def _frame():
+    rows = list(itertools.product(*VALUES.values()))
+    # 전체 조합은 크므로 고정 시드로 일부만 사용
+    rng = np.random.default_rng(0)
+    picked = rng.choice(len(rows), size=3000, replace=False)
+    return pd.DataFrame([rows[i] for i in picked], columns=list(VALUES))
+
+
+# 기준 시각: 경계값(시작까지 30/90일, 승인 후 3/6개월 등)이 걸리도록 여러 날짜 사용
+NOWS = [
+    datetime(2025, 9, 15, 10, 30),
+    datetime(2025, 9, 15),
+    datetime(2025, 9, 2),
+    datetime(2025, 9, 1),
+    datetime(2025, 11, 1),
+    datetime(2026, 1, 1),
+]
+
+
+def test_kernel_matches_numpy_path():
+    df = _frame()
+    for now in NOWS:
+        enc = urgency_scoring._encode_frame(df, now)
+        expected = urgency_scoring._score_arrays(enc, now)
+        actual = score_numba.score_arrays(enc, now)
+        for name, e, a in zip("ABCD", expected[:4], actual[:4]):
+            np.testing.assert_array_equal(a, e, err_msg=f"{name} @ {now}")
+        np.testing.assert_array_equal(actual[4], expected[4])
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from scoring import urgency_filter_52
+
+
+def _make_filter(tmp_path, monkeypatch, csv_text):
+    monkeypatch.setattr(urgency_filter_52, "project_root", tmp_path)
+    csv_path = tmp_path / "ctfc.csv"
+    csv_path.write_text(csv_text, encoding="utf-8-sig")
+    return urgency_filter_52.ImprovedUrgencyFilter(str(csv_path))
+
+
+def test_load_blank_numeric_cell(tmp_path, monkeypatch):
+    # 정수 컬럼(조회수)에 빈 셀이 있어도 로드되고, 날짜 컬럼은 'YYYY-MM-DD' 문자열(빈 값은 NaN)로 유지
+    fs = _make_filter(tmp_path, monkeypatch, (
+        "clncTestSn,조회수,임상시험 승인일자,최근 변경일자,진행상태,임상시험 단계\n"
+        "1,5,2025-01-02,,모집중,1상\n"
+        "2,,2025-02-03,2025-03-04,종료,2상\n"
+    ))
+    df = fs.load_and_prepare_data()
+
+    assert df["조회수"].isna().tolist() == [False, True]
+    assert df["임상시험 승인일자"].tolist() == ["2025-01-02", "2025-02-03"]
+    assert pd.isna(df["최근 변경일자"].iloc[0])
+    assert df["최근 변경일자"].iloc[1] == "2025-03-04"
+
+
+def test_top_n_tie_order_same_in_both_paths(tmp_path, monkeypatch):
+    # 동점은 입력 순서 — 전체 선택 경로(활성 ≤ n)와 다양성 할당 경로가 같은 순서를 내야 함
+    fs = _make_filter(tmp_path, monkeypatch, "clncTestSn\n")
+    scores = [50.0, 70.0, 50.0, 90.0, 70.0, 50.0, 10.0, 70.0]
+    fs.scored_df = pd.DataFrame({
+        "clncTestSn": range(len(scores)),
+        "진행상태": ["모집중"] * len(scores),
+        "대상질환명": ["폐암", "천식", "당뇨병", "폐암", "폐암", "천식", "당뇨병", "고혈압"],
+        "total_score_adjusted": scores,
+    })
+
+    all_rows = fs.extract_diversified_top_n(n=len(scores))
+    diversified = fs.extract_diversified_top_n(n=len(scores) - 1)
+
+    expected = [3, 1, 4, 7, 0, 2, 5, 6]  # 점수 내림차순, 동점은 원래 순서
+    assert all_rows["clncTestSn"].tolist() == expected
+    assert set(diversified["clncTestSn"]) <= set(expected)
+    assert diversified["total_score_adjusted"].is_monotonic_decreasing
+    for _, group in diversified.groupby("total_score_adjusted"):
+        assert group["clncTestSn"].is_monotonic_increasing
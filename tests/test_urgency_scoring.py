@@ -0,0 +1,182 @@
+import itertools
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoring import urgency_scoring
+from scoring.urgency_scoring import (
+    _add_months,
+    _months_since_approval,
+    _round1,
+    calculate_total_urgency_score,
+    score_dataframe,
+    warnings_to_str,
+    whole_months_between,
+)
+
+COLUMNS = [
+    "진행상태", "임상시험 단계", "임상시험 기간", "목표 대상자 수(국내)",
+    "대상질환명", "성별", "나이", "임상시험 승인일자",
+]
+
+# 각 분기를 지나도록 고른 컬럼 값 (조합 일부를 행 단위 계산과 비교)
+# 잘못된 월('13월')은 행 단위 parse_period가 ValueError를 내므로 제외
+VALUES = {
+    "진행상태": ["모집중", "승인완료", " 모집중 ", "모집완료", "종료", "기타", "", None],
+    "임상시험 단계": ["1상", "2상", "3상", "생동", "1/2상", "연구자 임상시험", "", None],
+    "임상시험 기간": [
+        "2024년 1월 ~ 2026년 12월",
+        "2025년 6월 ~ 2030년 6월",
+        "2025년 10월 ~ 2026년 3월",
+        "2025년 12월 ~ 2027년 1월",
+        "2027년 1월 ~ 2028년 1월",
+        "2020년 1월 ~ 2021년 1월",
+        "2026년 3월 ~ 2025년 3월",    # 종료가 시작보다 앞
+        "2025년 5월 ~ 2025년 5월",    # 0개월
+        "2025년 1월",                 # 한쪽만
+        "미정",
+        "",
+        None,
+    ],
+    "목표 대상자 수(국내)": ["120", "1,200", " 30 ", "+240", "7", "", "abc", "-5", "12명", None],
+    "대상질환명": [
+        "비소세포폐암", "희귀 신경면역 질환, first-in-human", "rare orphan disease",
+        "면역 질환", "FIH 고형 종양 환자", "감기", "", None,
+    ],
+    "성별": ["남", "■남 ■여", "여", "", None],
+    "나이": ["18세~40세", "18세 이상~65세 미만", "만 19세 이상", "", None],
+    "임상시험 승인일자": ["2025-01-24", "2025-03-15", "2025-06-15", "2025-07-01", "2024-02-29", " 2025-02-28 ", "x", "", None],
+}
+
+NOWS = [
+    datetime(2025, 9, 15, 10, 30),
+    datetime(2025, 9, 15),
+    datetime(2025, 9, 1),
+    datetime(2025, 11, 1),
+    datetime(2026, 1, 1),
+    datetime(2024, 3, 31, 23, 59),
+]
+
+MODES = ["baseline", "speed", "auto", "없는모드"]
+
+
+def _grid_frame(size=1500, seed=0):
+    # 전체 조합은 너무 크므로 컬럼마다 고정 시드로 값을 골라 조합
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {c: [VALUES[c][i] for i in rng.integers(len(VALUES[c]), size=size)] for c in COLUMNS}, dtype=object
+    )
+
+
+def _assert_matches_scalar(df, now, mode="baseline", with_adjustment=True):
+    """score_dataframe 결과를 행마다 calculate_total_urgency_score와 비교"""
+    out = score_dataframe(df, mode=mode, current_date=now, with_adjustment=with_adjustment)
+    for row, rec in zip(out.to_dict("records"), df.to_dict("records")):
+        ref = calculate_total_urgency_score(rec, mode=mode, current_date=now, with_adjustment=with_adjustment)
+        bd = ref["breakdown"]
+        assert [row["A"], row["B"], row["C"], row["D"]] == list(bd.values()), rec
+        assert row["total_score"] == ref["total_score"], rec
+        assert row["total_score_adjusted"] == ref["total_score_adjusted"], rec
+        assert row["warnings"] == ";".join(ref["warnings"]), rec
+        assert row["warnings"] == warnings_to_str(row["warnings_mask"]), rec
+        assert row["mode"] == ref["mode"], rec
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("now", NOWS, ids=str)
+def test_score_dataframe_matches_scalar(now, mode):
+    _assert_matches_scalar(_grid_frame(), now, mode)
+
+
+def test_score_dataframe_matches_scalar_without_adjustment():
+    _assert_matches_scalar(_grid_frame(seed=1), NOWS[0], "auto", with_adjustment=False)
+
+
+def _boundary_cases():
+    """D 점수 경계: 시작 당일, 시작까지 30/90일, 진행률 0.25/0.5, 승인 후 3/6개월 (자정/자정 이후 모두)"""
+    start = datetime(2024, 1, 1)
+    period = "2024년 1월 ~ 2024년 3월"  # 60일 → 15/30일째가 진행률 0.25/0.5
+    for offset in (timedelta(0), timedelta(hours=1), timedelta(hours=-1)):
+        for days in (0, 29, 30, 31, 89, 90, 91):
+            now = start - timedelta(days=days) + offset
+            yield now, [("승인완료", period, "2023-06-01")]
+        for days in (14, 15, 16, 29, 30, 31):
+            now = start + timedelta(days=days) + offset
+            yield now, [("모집중", period, "")]
+    for now in (datetime(2024, 3, 31), datetime(2024, 3, 31, 12), datetime(2024, 5, 1), datetime(2024, 8, 30, 6)):
+        rows = []
+        for months in (2, 3, 6, 7):
+            approved = _add_months(now.replace(hour=0, minute=0), -months)
+            for delta in (-1, 0, 1):
+                rows.append(("승인완료", period, (approved + timedelta(days=delta)).strftime("%Y-%m-%d")))
+        yield now, rows
+
+
+@pytest.mark.parametrize("now,rows", list(_boundary_cases()), ids=lambda v: str(v) if isinstance(v, datetime) else "")
+def test_time_sensitivity_boundaries_match_scalar(now, rows):
+    df = pd.DataFrame(
+        [
+            {"진행상태": st, "임상시험 단계": "2상", "임상시험 기간": period, "목표 대상자 수(국내)": "60",
+             "대상질환명": "비소세포폐암 환자", "성별": "", "나이": "", "임상시험 승인일자": approval}
+            for st, period, approval in rows
+        ],
+        columns=COLUMNS,
+        dtype=object,
+    )
+    _assert_matches_scalar(df, now)
+
+
+def _month_end_dates():
+    days = []
+    for y in (2023, 2024):
+        for m in range(1, 13):
+            first = datetime(y, m, 1)
+            last = _add_months(first, 1) - timedelta(days=1)
+            days += [first, last - timedelta(days=1), last]
+    return days
+
+
+@pytest.mark.parametrize("now", [
+    datetime(2024, 2, 29), datetime(2024, 2, 28, 12), datetime(2023, 2, 28), datetime(2024, 3, 31),
+    datetime(2024, 4, 30, 0, 0, 1), datetime(2024, 1, 31, 23, 59), datetime(2023, 6, 1), datetime(2024, 12, 31),
+], ids=str)
+def test_months_since_approval_matches_scalar(now):
+    dates = _month_end_dates()
+    approval = pd.Series([d.strftime("%Y-%m-%d") for d in dates] + ["2024-02-30", "x", "", None], dtype=object)
+    expected = [whole_months_between(d, now) for d in dates] + [0, 0, 0, 0]
+    assert _months_since_approval(approval, now).tolist() == expected
+
+
+def test_whole_months_between_matches_relativedelta():
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dates = _month_end_dates()
+    nows = dates + [d + timedelta(hours=6) for d in dates]
+    for start in dates:
+        for end in nows:
+            rd = relativedelta(end, start)
+            assert whole_months_between(start, end) == rd.years * 12 + rd.months, (start, end)
+
+
+def test_round1_matches_python_round():
+    # x.x5 경계(이진 표현상 위/아래로 치우친 값)와 실제 가중 합산 값
+    halves = np.arange(0, 100001, 5) / 1000.0
+    combos = [
+        urgency_scoring._combine_with_weights(bd, w)
+        for bd in itertools.product(range(0, 31, 1), range(5, 26, 4), range(5, 26, 5), (0, 5, 10, 15, 20))
+        for w in urgency_scoring.WEIGHTS_TUP.values()
+    ]
+    for values in (halves, np.array(combos), np.array(combos) * 0.97, np.array(combos) * 0.85):
+        assert _round1(values).tolist() == [round(float(v), 1) for v in values]
+
+
+def test_warnings_mask_round_trip():
+    names = urgency_scoring._WARNING_NAMES
+    for mask in range(1 << len(names)):
+        text = warnings_to_str(mask)
+        parts = text.split(";") if text else []
+        # build_warnings와 같은 순서, 비트로 되돌리면 원래 mask
+        assert parts == [n for i, n in enumerate(names) if mask >> i & 1]
+        assert sum(urgency_scoring._WARNING_BITS[p] for p in parts) == mask
+        assert urgency_scoring.count_warning_bits(np.array([mask]))[0] == len(parts)
@@ -1,6 +1,9 @@
 # year_analysis.py
+import numpy as np
+import pandas as pd
 import yaml
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
 
 def analyze_by_year():
@@ -11,43 +14,46 @@ def analyze_by_year():
     gc = gspread.authorize(creds)
     ws = gc.open_by_key(cfg['sheet_id']).worksheet(cfg['worksheet'])
     
-    # clncTestSn 가져오기
-    header = ws.row_values(1)
+    # clncTestSn 가져오기: 헤더와 A열(보통 clncTestSn)을 batch_get 한 번으로 조회
+    header_rows, rows = ws.batch_get(["1:1", "A2:A"], value_render_option="UNFORMATTED_VALUE")
+    header = header_rows[0] if header_rows else []
     clnc_col_idx = header.index('clncTestSn') + 1
-    sns = [int(sn) for sn in ws.col_values(clnc_col_idx)[1:] if sn.strip()]
+    if clnc_col_idx != 1:
+        col = rowcol_to_a1(1, clnc_col_idx).rstrip("1")
+        rows = ws.get(f"{col}2:{col}", value_render_option="UNFORMATTED_VALUE")
+    vals = pd.Series([r[0] if r else "" for r in rows], dtype=object)
+    sns = pd.to_numeric(vals, errors="coerce").dropna().astype("int64").to_numpy()
     
-    # 연도별 분석
-    year_stats = {}
-    for sn in sns:
-        year = int(str(sn)[:4])
-        if year not in year_stats:
-            year_stats[year] = []
-        year_stats[year].append(sn)
+    # 연도별 분석 (연도 = 일련번호 앞 4자리)
+    # (연도, 일련번호) 순으로 한 번만 정렬하고 연도 경계에서 잘라 씀 (자릿수가 달라도 연도별로 묶이도록 lexsort)
+    years = sns.astype("U4").astype(np.int64)
+    order = np.lexsort((sns, years))
+    sns, years = sns[order], years[order]
+    uniq_years = np.unique(years)
+    bounds = np.searchsorted(years, uniq_years).tolist() + [len(sns)]
     
     print("연도별 상세 분석:")
     print("=" * 50)
     
-    for year in sorted(year_stats.keys()):
-        sns_in_year = sorted(year_stats[year])
-        count = len(sns_in_year)
-        min_sn = min(sns_in_year)
-        max_sn = max(sns_in_year)
+    for year, lo, hi in zip(uniq_years, bounds[:-1], bounds[1:]):
+        sns_in_year = sns[lo:hi]
+        count = hi - lo
+        min_sn = sns_in_year[0]
+        max_sn = sns_in_year[-1]
         expected_range = max_sn - min_sn + 1
         missing = expected_range - count
         
         print(f"{year}년: {count}개 수집 (범위: {min_sn}~{max_sn})")
         print(f"  예상 범위: {expected_range}개, 빠짐: {missing}개")
         
-        # 각 연도의 갭 찾기
-        gaps = []
-        for i in range(len(sns_in_year) - 1):
-            gap = sns_in_year[i+1] - sns_in_year[i]
-            if gap > 1:
-                gaps.append((sns_in_year[i] + 1, sns_in_year[i+1] - 1, gap - 1))
+        # 각 연도의 갭 찾기 (인접 일련번호 차이가 1보다 큰 위치)
+        d = np.diff(sns_in_year)
+        idx = np.nonzero(d > 1)[0]
         
-        if gaps:
-            print(f"  빠진 구간: {len(gaps)}개")
-            for start, end, gap_count in gaps[:5]:  # 상위 5개만
+        if len(idx):
+            print(f"  빠진 구간: {len(idx)}개")
+            top = idx[:5]  # 상위 5개만
+            for start, end, gap_count in zip(sns_in_year[top] + 1, sns_in_year[top + 1] - 1, d[top] - 1):
                 print(f"    {start}~{end} ({gap_count}개)")
         print()
 